@@ -7,7 +7,7 @@ import json
 import os
 import httpx
 import websockets
-from typing import Any
+from typing import Any, AsyncIterator
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -23,8 +23,13 @@ MATTERS = "/matter-service"
 KNOWLEDGE = "/knowledge-service"
 TEMPLATES = "/templates-service"
 
+# Keep pooled connections alive across poll ticks (default expiry is 5s) and sized for gathered reads/uploads.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0)
 _WS_DEBUG = str(os.getenv("E2E_WS_DEBUG", "") or "").strip().lower() in {"1", "true", "yes"}
 _WS_BREAK_ON_BLOCKER = str(os.getenv("E2E_WS_BREAK_ON_BLOCKER", "1") or "").strip().lower() in {"1", "true", "yes"}
+_WS_EARLY_SETTLE_EVENTS = frozenset(
+    {"progress", "task_start", "awaiting_review", "blocked", "result", "error", "end", "complete"}
+)
 
 
 def _resolve_ws_proxy() -> str | bool | None:
@@ -131,7 +136,7 @@ class ApiClient:
     async def __aenter__(self) -> "ApiClient":
         # Chat endpoints are SSE streams and may take longer than typical JSON APIs.
         timeout_s = float(os.getenv("E2E_HTTP_TIMEOUT_S", "1800") or 1800)
-        self._client = httpx.AsyncClient(timeout=timeout_s, trust_env=False)
+        self._client = httpx.AsyncClient(timeout=timeout_s, trust_env=False, limits=_HTTP_LIMITS)
         return self
 
     async def __aexit__(self, *args):
@@ -239,10 +244,21 @@ class ApiClient:
             max_attempts = int(os.getenv("E2E_HTTP_WS_RETRIES", "180") or 180)
         last_exc: Exception | None = None
 
+        # Connection and stream settings are fixed for the whole round; resolve them once rather than
+        # per attempt / per received frame. Each round still gets its own socket: fire_and_poll rounds
+        # leave unread frames behind, so a reused connection would leak them into the next round.
+        proxy_value = _resolve_ws_proxy()
+        ping_interval = _resolve_ws_protocol_ping_interval()
+        # 文书起草链路在真实大模型下可持续数分钟，默认 180s 会提前切断会话并触发假性 busy。
+        max_stream_s = float(os.getenv("E2E_WS_STREAM_MAX_S", "1800") or 1800)
+        fire_and_poll_timeout_s = float(
+            os.getenv("E2E_WS_FIRE_AND_POLL_ACK_TIMEOUT_S", "8") or 8
+        )
+        event_timeout_s = float(os.getenv("E2E_WS_EVENT_TIMEOUT_S", "120") or 120)
+
         for attempt in range(1, max_attempts + 1):
             events: list[dict[str, Any]] = []
             try:
-                proxy_value = _resolve_ws_proxy()
                 async with websockets.connect(
                     ws_url,
                     proxy=proxy_value if isinstance(proxy_value, str) or proxy_value is None or proxy_value is True else None,
@@ -252,7 +268,7 @@ class ApiClient:
                     max_size=None,
                     # Keep protocol-level pings enabled by default so long-running rounds
                     # survive gateway/client idle timeouts. Disable via env if needed.
-                    ping_interval=_resolve_ws_protocol_ping_interval(),
+                    ping_interval=ping_interval,
                     ping_timeout=None,
                 ) as ws:
                     # Send auth message first
@@ -275,21 +291,6 @@ class ApiClient:
 
                     # Collect events until 'end'
                     stream_started = asyncio.get_running_loop().time()
-                    # 文书起草链路在真实大模型下可持续数分钟，默认 180s 会提前切断会话并触发假性 busy。
-                    max_stream_s = float(os.getenv("E2E_WS_STREAM_MAX_S", "1800") or 1800)
-                    early_settle_events = {
-                        "progress",
-                        "task_start",
-                        "awaiting_review",
-                        "blocked",
-                        "result",
-                        "error",
-                        "end",
-                        "complete",
-                    }
-                    fire_and_poll_timeout_s = float(
-                        os.getenv("E2E_WS_FIRE_AND_POLL_ACK_TIMEOUT_S", "8") or 8
-                    )
                     while True:
                         now = asyncio.get_running_loop().time()
                         if max_stream_s > 0 and (now - stream_started) > max_stream_s:
@@ -305,7 +306,7 @@ class ApiClient:
                             )
                             break
                         try:
-                            ws_event_timeout_s = float(os.getenv("E2E_WS_EVENT_TIMEOUT_S", "120") or 120)
+                            ws_event_timeout_s = event_timeout_s
                             if settle_mode == "fire_and_poll" and not events:
                                 ws_event_timeout_s = max(1.0, fire_and_poll_timeout_s)
                             raw = await asyncio.wait_for(ws.recv(), timeout=ws_event_timeout_s)
@@ -339,7 +340,7 @@ class ApiClient:
 
                             events.append({"event": evt, "data": evt_data})
 
-                            if settle_mode in {"first_event", "fire_and_poll"} and evt in early_settle_events:
+                            if settle_mode in {"first_event", "fire_and_poll"} and evt in _WS_EARLY_SETTLE_EVENTS:
                                 break
 
                             if evt in {"awaiting_review", "blocked"} and _WS_BREAK_ON_BLOCKER:
@@ -600,9 +601,8 @@ class ApiClient:
                     target_document_kind=target_kind,
                     supporting_document_kinds=normalized_supporting_document_kinds,
                 )
-                mid_candidate = str(
-                    ((created.get("data") or {}) if isinstance(created, dict) else {}).get("id") or ""
-                ).strip()
+                created_data = created.get("data") if isinstance(created, dict) else None
+                mid_candidate = str(created_data.get("id") or "").strip() if isinstance(created_data, dict) else ""
                 if not mid_candidate:
                     if attempt < max_attempts:
                         await asyncio.sleep(min(2.0, 0.4 * attempt))
@@ -874,9 +874,20 @@ class ApiClient:
     ) -> dict[str, Any]:
         """Upload a file via files-service (multipart)."""
         path = Path(file_path)
-        if not path.exists() or not path.is_file():
+        if not path.is_file():
             raise FileNotFoundError(file_path)
+        return await self.upload_bytes(path.name, path.read_bytes(), purpose=purpose)
+
+    async def upload_bytes(
+        self,
+        filename: str,
+        content: bytes,
+        purpose: str = "consultation",
+    ) -> dict[str, Any]:
+        """Upload in-memory content via files-service (multipart).
 
+        The payload is read once by the caller and re-sent as-is on transient retries.
+        """
         route_path = f"{FILES}/files/upload"
         base_url, stripped_path = self._resolve_base_for_path(route_path)
         url = f"{base_url}{stripped_path}"
@@ -899,11 +910,10 @@ class ApiClient:
             )
         for attempt in range(1, max_attempts + 1):
             try:
-                with path.open("rb") as f:
-                    files = {"file": (path.name, f)}
-                    resp = await client.post(
-                        url, headers=headers, params=params, files=files
-                    )
+                files = {"file": (filename, content)}
+                resp = await client.post(
+                    url, headers=headers, params=params, files=files
+                )
                 if resp.status_code in transient and attempt < max_attempts:
                     await asyncio.sleep(min(4.0, 0.5 * attempt))
                     continue
@@ -917,16 +927,19 @@ class ApiClient:
 
         raise last_exc if last_exc else RuntimeError("upload file failed")
 
-    async def download_file_bytes(self, file_id: str) -> bytes:
-        """Download a file's raw bytes via files-service."""
+    def _file_download_request(self, file_id: str) -> tuple[str, dict[str, str]]:
         fid = str(file_id).strip()
         if not fid:
             raise ValueError("file_id is required")
         route_path = f"{FILES}/files/{fid}/download"
         base_url, stripped_path = self._resolve_base_for_path(route_path)
-        url = f"{base_url}{stripped_path}"
         headers = dict(self.headers)
         headers.pop("Content-Type", None)
+        return f"{base_url}{stripped_path}", headers
+
+    async def download_file_bytes(self, file_id: str) -> bytes:
+        """Download a file's raw bytes via files-service."""
+        url, headers = self._file_download_request(file_id)
         client = self._client
         if client is None:
             raise RuntimeError(
@@ -936,6 +949,21 @@ class ApiClient:
         resp.raise_for_status()
         return resp.content
 
+    async def download_file_stream(
+        self, file_id: str, *, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """Stream a file's raw bytes via files-service without buffering the whole body."""
+        url, headers = self._file_download_request(file_id)
+        client = self._client
+        if client is None:
+            raise RuntimeError(
+                "ApiClient is not initialized; use 'async with ApiClient(...)'"
+            )
+        async with client.stream("GET", url, headers=headers) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.aiter_bytes(chunk_size):
+                yield chunk
+
     # ========== Matters ==========
 
     async def create_matter(
@@ -17,7 +17,7 @@ def _resolve_ai_engine_python(repo_root: Path) -> Path:
         repo_root / "ai-engine-v2" / ".venv312" / "bin" / "python",
     )
     for path in candidates:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path
     raise RuntimeError("diagnostic_export_runtime_missing")
 
@@ -34,7 +34,7 @@ def _resolve_ai_engine_env_file(repo_root: Path) -> Path:
         if path is not None
     )
     for path in candidates:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path
     raise RuntimeError("diagnostic_export_env_missing")
 
@@ -44,7 +44,7 @@ def _resolve_ai_engine_export_script(repo_root: Path) -> Path:
         repo_root / "ai-engine-v2" / "scripts" / "export_debug_bundle.py",
     )
     for path in candidates:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path
     raise RuntimeError("diagnostic_export_script_missing")
 
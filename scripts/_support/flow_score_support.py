@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from support.workbench.docx import (
     assert_docx_has_no_template_placeholders,
@@ -11,7 +12,7 @@ from support.workbench.docx import (
     score_legal_opinion_docx_benchmark,
 )
 from support.workbench.timeline import produced_output_keys, unwrap_timeline
-from support.workbench.utils import unwrap_api_response
+from support.workbench.utils import unwrap_api_response, unwrap_list
 
 
 def _safe_str(value: Any) -> str:
@@ -58,8 +59,7 @@ _CITATION_RE = re.compile(r"《[^》]{2,40}》第[一二三四五六七八九十
 _CONTRACT_REVIEW_OUTPUT_KEYS = ("contract_review_report",)
 
 
-def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[3]
+_REPO_ROOT = Path(__file__).resolve().parents[3]
 
 
 def _read_json(path: Path) -> dict[str, Any]:
@@ -75,7 +75,7 @@ def _bundle_dir_for_session(session_id: str) -> Path | None:
     if not token:
         return None
     thread_id = token if token.startswith("session:") else f"session:{token}"
-    bundle_dir = _repo_root() / "output" / "ai-debug-bundles" / thread_id
+    bundle_dir = _REPO_ROOT / "output" / "ai-debug-bundles" / thread_id
     return bundle_dir if bundle_dir.exists() else None
 
 
@@ -230,6 +230,27 @@ def _missing_section_markers(text: str, expectations: dict[str, Any] | None = No
     return missing
 
 
+async def _observe(
+    results: dict[str, Any],
+    errors: dict[str, str],
+    key: str,
+    fetch: Awaitable[Any],
+    parse: Callable[[Any], Any],
+) -> None:
+    try:
+        results[key] = parse(await fetch)
+    except Exception as exc:  # noqa: BLE001
+        errors[key] = str(exc)
+
+
+def _as_dict_payload(resp: Any) -> dict[str, Any]:
+    return _as_dict(unwrap_api_response(resp))
+
+
+def _trace_rows(resp: Any) -> list[dict[str, Any]]:
+    return unwrap_list(resp, "traces")
+
+
 async def collect_flow_observability(
     client: Any,
     *,
@@ -239,40 +260,28 @@ async def collect_flow_observability(
     trace_limit: int = 120,
 ) -> dict[str, Any]:
     errors: dict[str, str] = {}
-    matter_timeline: dict[str, Any] = {}
-    phase_timeline: dict[str, Any] = {}
-    matter_traces: list[dict[str, Any]] = []
-    session_timeline: dict[str, Any] = {}
-    session_traces: list[dict[str, Any]] = []
+    results: dict[str, Any] = {}
+    reads: list[Awaitable[None]] = []
 
+    # The reads are independent; issue them together so collection costs the slowest one.
     if _safe_str(matter_id):
-        try:
-            matter_timeline = unwrap_timeline(await client.get_matter_timeline(matter_id, limit=timeline_limit))
-        except Exception as exc:  # noqa: BLE001
-            errors["matter_timeline"] = str(exc)
-        try:
-            raw = unwrap_api_response(await client.get_matter_phase_timeline(matter_id))
-            phase_timeline = raw if isinstance(raw, dict) else {}
-        except Exception as exc:  # noqa: BLE001
-            errors["phase_timeline"] = str(exc)
-        try:
-            data = unwrap_api_response(await client.list_traces(matter_id, limit=trace_limit))
-            rows = data.get("traces") if isinstance(data, dict) else None
-            matter_traces = [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
-        except Exception as exc:  # noqa: BLE001
-            errors["matter_traces"] = str(exc)
-
+        reads += [
+            _observe(results, errors, "matter_timeline", client.get_matter_timeline(matter_id, limit=timeline_limit), unwrap_timeline),
+            _observe(results, errors, "phase_timeline", client.get_matter_phase_timeline(matter_id), _as_dict_payload),
+            _observe(results, errors, "matter_traces", client.list_traces(matter_id, limit=trace_limit), _trace_rows),
+        ]
     if _safe_str(session_id):
-        try:
-            session_timeline = unwrap_timeline(await client.get_session_timeline(session_id, limit=timeline_limit))
-        except Exception as exc:  # noqa: BLE001
-            errors["session_timeline"] = str(exc)
-        try:
-            data = unwrap_api_response(await client.list_session_traces(session_id, limit=trace_limit))
-            rows = data.get("traces") if isinstance(data, dict) else None
-            session_traces = [row for row in rows if isinstance(row, dict)] if isinstance(rows, list) else []
-        except Exception as exc:  # noqa: BLE001
-            errors["session_traces"] = str(exc)
+        reads += [
+            _observe(results, errors, "session_timeline", client.get_session_timeline(session_id, limit=timeline_limit), unwrap_timeline),
+            _observe(results, errors, "session_traces", client.list_session_traces(session_id, limit=trace_limit), _trace_rows),
+        ]
+    await asyncio.gather(*reads)
+
+    matter_timeline: dict[str, Any] = results.get("matter_timeline", {})
+    phase_timeline: dict[str, Any] = results.get("phase_timeline", {})
+    matter_traces: list[dict[str, Any]] = results.get("matter_traces", [])
+    session_timeline: dict[str, Any] = results.get("session_timeline", {})
+    session_traces: list[dict[str, Any]] = results.get("session_traces", [])
 
     bundle_timeline, bundle_traces = _load_bundle_observability(session_id)
     synthesized_bundle_timeline = _bundle_round_timeline(
@@ -307,6 +316,12 @@ async def collect_flow_observability(
     }
 
 
+def _data_field_group(field_key: str) -> str:
+    """Return the group segment of a `data.<group>.<...>` field key."""
+    parts = [part for part in field_key.split(".") if part.strip()]
+    return parts[1] if len(parts) > 1 else ""
+
+
 def _card_field_issues(*, flow_id: str, card: dict[str, Any]) -> list[str]:
     payload = _as_dict(card.get("card")) if isinstance(card.get("card"), dict) else card
     policy = _FLOW_CARD_POLICY.get(flow_id, {})
@@ -329,8 +344,7 @@ def _card_field_issues(*, flow_id: str, card: dict[str, Any]) -> list[str]:
         if fk.startswith("profile.") or fk == "data.workbench.goal":
             continue
         if fk.startswith("data."):
-            parts = [part for part in fk.split(".") if _safe_str(part)]
-            group = parts[1] if len(parts) > 1 else ""
+            group = _data_field_group(fk)
             if group not in allowed_groups:
                 issues.append(f"unexpected_data_group:{group or 'missing'}")
             continue
@@ -139,13 +139,15 @@ def _latest_trace_progress(execution_traces: list[dict[str, Any]] | None) -> dic
             current_row = row
             break
 
+    # Traces only grow over a run; scan from the tail so each poll stops at the newest completed phase.
     last_completed_phase = ""
-    for row in rows:
+    for row in reversed(rows):
         if safe_str(row.get("status")).lower() != "completed":
             continue
         phase = _trace_phase_token(row)
         if phase:
             last_completed_phase = phase
+            break
 
     phase_id = _trace_phase_token(current_row)
     current_node = safe_str(current_row.get("node_name") or current_row.get("node_id"))
@@ -163,6 +165,21 @@ def extract_runtime_progress(
     *,
     execution_snapshot: dict[str, Any] | None = None,
     execution_traces: list[dict[str, Any]] | None = None,
+) -> dict[str, str]:
+    return _runtime_progress(
+        snapshot,
+        execution_snapshot=execution_snapshot,
+        execution_traces=execution_traces,
+        trace_progress=_latest_trace_progress(execution_traces),
+    )
+
+
+def _runtime_progress(
+    snapshot: dict[str, Any] | None,
+    *,
+    execution_snapshot: dict[str, Any] | None,
+    execution_traces: list[dict[str, Any]] | None,
+    trace_progress: dict[str, str],
 ) -> dict[str, str]:
     if not isinstance(snapshot, dict) and not isinstance(execution_snapshot, dict) and not execution_traces:
         return {
@@ -180,7 +197,6 @@ def extract_runtime_progress(
     analysis = snapshot_obj.get("analysis_state") if isinstance(snapshot_obj.get("analysis_state"), dict) else {}
     identity = analysis.get("identity") if isinstance(analysis.get("identity"), dict) else {}
     runtime = analysis.get("workbench_runtime") if isinstance(analysis.get("workbench_runtime"), dict) else {}
-    trace_progress = _latest_trace_progress(execution_traces)
     phase_source = execution_snapshot if isinstance(execution_snapshot, dict) and workflow else snapshot_obj
     phase_id, phase_label = _phase_from_snapshot(phase_source)
     last_completed_phase, last_completed_phase_label = _latest_completed_phase(workflow)
@@ -314,10 +330,13 @@ class RunStatusSupervisor:
     ) -> None:
         if self.terminal_locked and safe_str(status) not in TERMINAL_RUN_STATUSES:
             return
-        progress = extract_runtime_progress(
+        # Scan the trace list once per update; it feeds both the progress fields and the digest.
+        latest_trace = _latest_trace_progress(execution_traces)
+        progress = _runtime_progress(
             snapshot,
             execution_snapshot=execution_snapshot,
             execution_traces=execution_traces,
+            trace_progress=latest_trace,
         )
         artifacts = dict(self.artifact_refs)
         if isinstance(artifact_refs, dict):
@@ -359,9 +378,8 @@ class RunStatusSupervisor:
                 "phase_label": progress["phase_label"],
             }
         if execution_traces:
-            latest_trace = _latest_trace_progress(execution_traces)
             payload["execution_traces_digest"] = {
-                "trace_count": len([row for row in execution_traces if isinstance(row, dict)]),
+                "trace_count": sum(1 for row in execution_traces if isinstance(row, dict)),
                 "phase_id": latest_trace["phase_id"],
                 "current_node": latest_trace["current_node"],
                 "last_completed_phase": latest_trace["last_completed_phase"],
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
 import json
 import os
 import signal
 import subprocess
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 from urllib.parse import quote
 
 from dotenv import load_dotenv
@@ -15,7 +18,7 @@ from httpx import HTTPStatusError
 
 from client.api_client import ApiClient
 from support.workbench.flow_runner import WorkbenchFlow
-from support.workbench.utils import unwrap_api_response
+from support.workbench.utils import extract_id, unwrap_api_response, unwrap_list
 
 _DEFAULT_REMOTE_STACK_HOST = "8.148.207.157"
 _REMOTE_SERVICE_PORTS: dict[str, int] = {
@@ -33,6 +36,8 @@ _DEFAULT_LOCAL_MATTER_PORT = 18020
 _DEFAULT_LOCAL_TEMPLATES_PORT = 18022
 _DEFAULT_LOCAL_AI_ENGINE_V2_PORT = 18086
 _DEFAULT_REMOTE_AI_ENGINE_V2_PORT = 18114
+# upload_file holds each file in memory while it is sent; cap how many are in flight at once.
+_UPLOAD_CONCURRENCY = 4
 
 
 def safe_str(value: Any) -> str:
@@ -388,15 +393,16 @@ def resolve_output_dir(*, repo_root: Path, output_dir: str, default_leaf: str) -
 
 
 async def upload_consultation_files(client: ApiClient, paths: list[Path]) -> list[str]:
-    uploaded_file_ids: list[str] = []
-    for path in paths:
-        if not path.exists():
-            continue
-        upload = await client.upload_file(str(path), purpose="consultation")
-        file_id = safe_str(((upload.get("data") or {}) if isinstance(upload, dict) else {}).get("id"))
-        if file_id:
-            uploaded_file_ids.append(file_id)
-    return uploaded_file_ids
+    existing = [path for path in paths if path.exists()]
+    limit = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+
+    async def _upload(path: Path) -> Any:
+        async with limit:
+            return await client.upload_file(str(path), purpose="consultation")
+
+    # Uploads are independent; gather keeps input order so attachment order stays deterministic.
+    uploads = await asyncio.gather(*(_upload(path) for path in existing))
+    return [file_id for file_id in (extract_id(upload) for upload in uploads) if file_id]
 
 
 async def bootstrap_flow(
@@ -423,9 +429,8 @@ async def bootstrap_flow(
         if isinstance(payload.get("supporting_document_kinds"), list)
         else [],
     )
-    sess_data = (sess.get("data") if isinstance(sess, dict) else {}) or {}
-    session_id = safe_str(sess_data.get("id"))
-    matter_id = safe_str(sess_data.get("matter_id"))
+    session_id = extract_id(sess)
+    matter_id = extract_id(sess, key="matter_id")
     if not session_id:
         raise RuntimeError(f"create_session failed: {sess}")
     if matter_id and preseed_profile:
@@ -457,18 +462,55 @@ async def fetch_workbench_snapshot(client: ApiClient, matter_id: str) -> dict[st
     return payload if isinstance(payload, dict) else None
 
 
-async def fetch_execution_snapshot_by_session(session_id: str) -> dict[str, Any] | None:
-    session_token = safe_str(session_id)
-    if not session_token:
-        return None
+_AI_ENGINE_HTTP: contextvars.ContextVar[httpx.AsyncClient | None] = contextvars.ContextVar(
+    "ai_engine_http", default=None
+)
+
+
+def _ai_engine_timeout_s() -> float:
+    return max(5.0, float(os.getenv("E2E_HTTP_REQUEST_TIMEOUT_S", "45") or 45))
+
+
+@contextlib.asynccontextmanager
+async def ai_engine_http_session() -> AsyncIterator[httpx.AsyncClient]:
+    """Share one pooled keep-alive client for ai-engine execution reads within this scope.
+
+    Real-flow scripts poll execution snapshots/traces on every round; without a shared pool each
+    read pays a fresh TCP connect per candidate base URL.
+    """
+    async with httpx.AsyncClient(timeout=_ai_engine_timeout_s(), trust_env=False) as raw_client:
+        token = _AI_ENGINE_HTTP.set(raw_client)
+        try:
+            yield raw_client
+        finally:
+            _AI_ENGINE_HTTP.reset(token)
+
+
+@contextlib.asynccontextmanager
+async def _ai_engine_client() -> AsyncIterator[httpx.AsyncClient]:
+    shared = _AI_ENGINE_HTTP.get()
+    if shared is not None and not shared.is_closed:
+        yield shared
+        return
+    async with httpx.AsyncClient(timeout=_ai_engine_timeout_s(), trust_env=False) as raw_client:
+        yield raw_client
+
+
+def _execution_thread_request(session_token: str) -> tuple[str, dict[str, str]]:
     thread_id = session_token if session_token.startswith("session:") else f"session:{session_token}"
-    thread_token = quote(thread_id, safe="")
     headers = {"Accept": "application/json"}
     internal_api_key = safe_str(os.getenv("INTERNAL_API_KEY"))
     if internal_api_key:
         headers["X-Internal-Api-Key"] = internal_api_key
-    timeout_s = max(5.0, float(os.getenv("E2E_HTTP_REQUEST_TIMEOUT_S", "45") or 45))
-    async with httpx.AsyncClient(timeout=timeout_s, trust_env=False) as raw_client:
+    return quote(thread_id, safe=""), headers
+
+
+async def fetch_execution_snapshot_by_session(session_id: str) -> dict[str, Any] | None:
+    session_token = safe_str(session_id)
+    if not session_token:
+        return None
+    thread_token, headers = _execution_thread_request(session_token)
+    async with _ai_engine_client() as raw_client:
         for base_url in _candidate_ai_engine_base_urls():
             url = f"{base_url}/api/v1/internal/executions/by-thread/{thread_token}/snapshot"
             try:
@@ -491,14 +533,8 @@ async def fetch_execution_traces_by_session(
     session_token = safe_str(session_id)
     if not session_token:
         return []
-    thread_id = session_token if session_token.startswith("session:") else f"session:{session_token}"
-    thread_token = quote(thread_id, safe="")
-    headers = {"Accept": "application/json"}
-    internal_api_key = safe_str(os.getenv("INTERNAL_API_KEY"))
-    if internal_api_key:
-        headers["X-Internal-Api-Key"] = internal_api_key
-    timeout_s = max(5.0, float(os.getenv("E2E_HTTP_REQUEST_TIMEOUT_S", "45") or 45))
-    async with httpx.AsyncClient(timeout=timeout_s, trust_env=False) as raw_client:
+    thread_token, headers = _execution_thread_request(session_token)
+    async with _ai_engine_client() as raw_client:
         for base_url in _candidate_ai_engine_base_urls():
             url = f"{base_url}/api/v1/internal/executions/by-thread/{thread_token}/traces"
             try:
@@ -507,9 +543,7 @@ async def fetch_execution_traces_by_session(
                 payload = response.json()
             except Exception:
                 continue
-            data = unwrap_api_response(payload)
-            traces = data.get("traces") if isinstance(data, dict) and isinstance(data.get("traces"), list) else []
-            rows = [row for row in traces if isinstance(row, dict)]
+            rows = unwrap_list(payload, "traces")
             if rows:
                 return rows
     return []
@@ -523,9 +557,7 @@ async def list_session_messages(client: ApiClient, session_id: str) -> list[dict
         )
     except Exception:
         return []
-    data = unwrap_api_response(resp)
-    rows = data.get("data") if isinstance(data, dict) and isinstance(data.get("data"), list) else []
-    return [row for row in rows if isinstance(row, dict)]
+    return unwrap_list(resp, "data")
 
 
 async def list_deliverables(client: ApiClient, matter_id: str) -> dict[str, dict[str, Any]]:
@@ -533,12 +565,8 @@ async def list_deliverables(client: ApiClient, matter_id: str) -> dict[str, dict
         resp = await client.list_deliverables(matter_id)
     except Exception:
         return {}
-    data = unwrap_api_response(resp)
-    rows = data.get("deliverables") if isinstance(data, dict) and isinstance(data.get("deliverables"), list) else []
     out: dict[str, dict[str, Any]] = {}
-    for row in rows:
-        if not isinstance(row, dict):
-            continue
+    for row in unwrap_list(resp, "deliverables"):
         key = safe_str(row.get("output_key"))
         if key:
             out[key] = row
@@ -642,6 +670,7 @@ async def collect_ai_debug_refs(
 
 
 __all__ = [
+    "ai_engine_http_session",
     "api_url",
     "bootstrap_flow",
     "collect_ai_debug_refs",
@@ -22,9 +22,12 @@ from client.api_client import ApiClient
 from support.workbench.docx import (
     assert_docx_has_no_template_placeholders,
     extract_docx_text,
+    fetch_docx,
 )
 from support.workbench.flow_runner import WorkbenchFlow
+from support.workbench.utils import resolved
 from scripts._support.workflow_real_flow_support import (
+    ai_engine_http_session,
     bootstrap_flow,
     collect_ai_debug_refs,
     configure_direct_service_mode,
@@ -46,6 +49,7 @@ from scripts._support.run_status import RunStatusSupervisor
 
 
 REQUIRED_DOC_OUTPUT_KEYS = ("contract_review_report",)
+READY_REPORT_STATUSES = frozenset({"draft", "review_pending", "approved", "published", "ready"})
 
 DEFAULT_USER_QUERY = (
     "请审查已上传合同并输出结构化结论：整体风险等级、合同类型、审查摘要、风险条款清单。"
@@ -86,7 +90,7 @@ def _select_contract_file(cli_value: str, *, contract_type_id: str) -> Path:
         E2E_ROOT / "fixtures/workbench/contract_review/sample_contract.txt",
     ]
     for p in candidates:
-        if p.exists() and p.is_file():
+        if p.is_file():
             return p
     raise FileNotFoundError("未找到可用合同文件，请通过 --contract-file 显式指定。")
 
@@ -442,7 +446,7 @@ async def run(args: argparse.Namespace) -> int:
         (out_dir / "runtime_images.start.json").write_text(json.dumps(start_images, ensure_ascii=False, indent=2), encoding="utf-8")
         print(f"[runtime] start_images={start_images}")
 
-    async with ApiClient(base_url) as client:
+    async with ApiClient(base_url) as client, ai_engine_http_session():
         await client.login(username, password)
         print(f"[login] ok user_id={client.user_id} org_id={client.organization_id}")
         supervisor.update(status="booting", progress_label="bootstrap.login", next_action="upload_contract")
@@ -517,12 +521,15 @@ async def run(args: argparse.Namespace) -> int:
         async def _deliverables_ready(f: WorkbenchFlow) -> bool:
             nonlocal last_runtime_snapshot
             await f.refresh()
-            runtime_snapshot = await _fetch_execution_snapshot(session_id)
-            runtime_traces = await _fetch_execution_traces(session_id)
-            last_runtime_snapshot = runtime_snapshot if isinstance(runtime_snapshot, dict) else {}
             runtime_matter_id = _safe_str(f.matter_id) or matter_id
-            runtime_snapshot_view = await _fetch_snapshot(client, runtime_matter_id) if runtime_matter_id else {}
-            runtime_pending_card = await f.get_current_blocker()
+            # The remaining reads only depend on the refreshed matter id; issue them together.
+            runtime_snapshot, runtime_traces, runtime_snapshot_view, runtime_pending_card = await asyncio.gather(
+                _fetch_execution_snapshot(session_id),
+                _fetch_execution_traces(session_id),
+                _fetch_snapshot(client, runtime_matter_id) if runtime_matter_id else resolved({}),
+                f.get_current_blocker(),
+            )
+            last_runtime_snapshot = runtime_snapshot if isinstance(runtime_snapshot, dict) else {}
             supervisor.update(
                 status="running",
                 progress_label="deliverables.waiting",
@@ -542,7 +549,7 @@ async def run(args: argparse.Namespace) -> int:
             if not report:
                 return False
             status = _safe_str(report.get("status")).lower()
-            if status and status not in {"draft", "review_pending", "approved", "published", "ready"}:
+            if status and status not in READY_REPORT_STATUSES:
                 return False
             file_ref = _safe_str(report.get("file_id"))
             inline_text = _safe_str(report.get("full_text"))
@@ -557,17 +564,20 @@ async def run(args: argparse.Namespace) -> int:
         except Exception as e:
             await flow.refresh()
             fail_matter_id = _safe_str(flow.matter_id) or matter_id
-            fail_snapshot = await _fetch_snapshot(client, fail_matter_id) if fail_matter_id else {}
-            fail_runtime_snapshot = await _fetch_execution_snapshot(session_id)
-            fail_runtime_traces = await _fetch_execution_traces(session_id)
-            fail_artifacts = _extract_runtime_deliverables(fail_runtime_snapshot)
-            fail_messages = await _list_session_messages(client, session_id)
-            debug_refs = await collect_ai_debug_refs(
-                client,
-                repo_root=REPO_ROOT,
-                session_id=session_id,
-                matter_id=fail_matter_id,
+            # Diagnostics reads only depend on the refreshed matter id; fetch them together.
+            fail_snapshot, fail_runtime_snapshot, fail_runtime_traces, fail_messages, debug_refs = await asyncio.gather(
+                _fetch_snapshot(client, fail_matter_id) if fail_matter_id else resolved({}),
+                _fetch_execution_snapshot(session_id),
+                _fetch_execution_traces(session_id),
+                _list_session_messages(client, session_id),
+                collect_ai_debug_refs(
+                    client,
+                    repo_root=REPO_ROOT,
+                    session_id=session_id,
+                    matter_id=fail_matter_id,
+                ),
             )
+            fail_artifacts = _extract_runtime_deliverables(fail_runtime_snapshot)
             fail_contract_view = _build_contract_view(
                 fail_snapshot if isinstance(fail_snapshot, dict) else {},
                 contract_type_id=contract_type_id,
@@ -636,24 +646,28 @@ async def run(args: argparse.Namespace) -> int:
         if not final_matter_id:
             raise RuntimeError("matter_id missing after workflow run")
 
-        execution_snapshot = await _fetch_execution_snapshot(session_id)
-        execution_traces = await _fetch_execution_traces(session_id)
+        # Post-run reads are independent of each other; run them together.
+        execution_snapshot, execution_traces, snapshot, current_blocker = await asyncio.gather(
+            _fetch_execution_snapshot(session_id),
+            _fetch_execution_traces(session_id),
+            _fetch_snapshot(client, final_matter_id),
+            flow.get_current_blocker(),
+        )
         if not isinstance(execution_snapshot, dict) or not execution_snapshot:
             raise RuntimeError("execution_snapshot_missing")
         artifacts = _extract_runtime_deliverables(execution_snapshot)
-        snapshot = await _fetch_snapshot(client, final_matter_id) or {}
+        snapshot = snapshot or {}
         contract_view = _build_contract_view(
             snapshot,
             contract_type_id=contract_type_id,
             review_scope=review_scope,
         )
-        current_blocker = await flow.get_current_blocker()
 
-        report_file_id = _safe_str((artifacts.get("contract_review_report") or {}).get("file_id"))
-        report_text = _safe_str((artifacts.get("contract_review_report") or {}).get("full_text"))
+        report_row = artifacts.get("contract_review_report") or {}
+        report_file_id = _safe_str(report_row.get("file_id"))
+        report_text = _safe_str(report_row.get("full_text"))
         if report_file_id:
-            raw = await client.download_file_bytes(report_file_id)
-            report_text = extract_docx_text(raw)
+            report_text = extract_docx_text(await fetch_docx(client, report_file_id))
             if args.assert_docx:
                 assert_docx_has_no_template_placeholders(report_text)
 
@@ -725,7 +739,7 @@ async def run(args: argparse.Namespace) -> int:
             aux_views={},
             deliverables=artifacts,
             deliverable_text=report_text,
-            artifact_status=_safe_str((artifacts.get("contract_review_report") or {}).get("status")),
+            artifact_status=_safe_str(report_row.get("status")),
             gold_text=_safe_str(contract_review_expectations.get("gold_text")),
             contract_review_expectations=cast(dict[str, Any], contract_review_expectations),
             observability=observability,
@@ -17,8 +17,9 @@ REPO_ROOT = E2E_ROOT.parent
 sys.path.insert(0, str(E2E_ROOT))
 
 from client.api_client import ApiClient
-from support.workbench.docx import extract_docx_text
+from support.workbench.docx import extract_docx_text, fetch_docx
 from support.workbench.flow_runner import WorkbenchFlow, is_session_busy_sse
+from support.workbench.utils import backoff_delay, resolved
 
 from scripts._support.flow_score_support import (
     build_flow_scores,
@@ -31,6 +32,7 @@ from scripts._support.legal_opinion_real_flow_support import (
 from scripts._support.diagnostic_bundle_support import export_failure_bundle, export_observability_bundle, format_first_bad_line
 from scripts._support.quality_policy_support import build_bundle_quality_reports, merge_bundle_quality_report
 from scripts._support.workflow_real_flow_support import (
+    ai_engine_http_session,
     bootstrap_flow,
     collect_ai_debug_refs,
     configure_direct_service_mode,
@@ -672,11 +674,9 @@ def _resolve_fixture_paths(rel_paths: tuple[str, ...] | list[str]) -> list[Path]
         token = _safe_str(rel)
         if not token:
             continue
-        candidates = [
-            (REPO_ROOT / token).resolve(),
-            (E2E_ROOT / token).resolve(),
-        ]
-        for candidate in candidates:
+        # Resolve lazily: the E2E-root candidate is only stat'ed when the repo-root one is missing.
+        for base in (REPO_ROOT, E2E_ROOT):
+            candidate = (base / token).resolve()
             if not candidate.exists() or candidate in seen:
                 continue
             seen.add(candidate)
@@ -697,8 +697,7 @@ async def _download_primary_legal_opinion_text(
     file_id = _safe_str(row.get("file_id"))
     if not file_id:
         return "", artifact_status
-    raw = await client.download_file_bytes(file_id)
-    content = extract_docx_text(raw)
+    content = extract_docx_text(await fetch_docx(client, file_id))
     if content:
         (out_dir / leaf_name).write_text(content, encoding="utf-8")
     return content, artifact_status
@@ -716,14 +715,17 @@ async def _collect_round_state(
 ) -> dict[str, Any]:
     await flow.refresh()
     matter_id = _safe_str(flow.matter_id)
-    snapshot = await fetch_workbench_snapshot(client, matter_id) if matter_id else {}
-    execution_snapshot = await fetch_execution_snapshot_by_session(session_id)
-    execution_traces = await fetch_execution_traces_by_session(session_id)
+    snapshot, execution_snapshot, execution_traces, current_blocker, raw_deliverables, messages = await asyncio.gather(
+        fetch_workbench_snapshot(client, matter_id) if matter_id else resolved({}),
+        fetch_execution_snapshot_by_session(session_id),
+        fetch_execution_traces_by_session(session_id),
+        flow.get_current_blocker(),
+        list_deliverables(client, matter_id) if matter_id else resolved({}),
+        list_session_messages(client, session_id),
+    )
     analysis_projection = _extract_legal_opinion_projection(snapshot)
     typed_render_state = _extract_typed_render_state(snapshot)
-    current_blocker = await flow.get_current_blocker()
-    deliverables = _alias_deliverables(await list_deliverables(client, matter_id)) if matter_id else {}
-    messages = await list_session_messages(client, session_id)
+    deliverables = _alias_deliverables(raw_deliverables)
     deliverable_text, artifact_status = await _download_primary_legal_opinion_text(
         client,
         deliverables=deliverables,
@@ -878,7 +880,7 @@ async def run(args: argparse.Namespace) -> int:
     print(f"[config] user={username}")
     print(f"[config] output_dir={out_dir}")
 
-    async with ApiClient(base_url) as client:
+    async with ApiClient(base_url) as client, ai_engine_http_session():
         await client.login(username, password)
         print(f"[login] ok user_id={client.user_id} org_id={client.organization_id}")
         supervisor.update(status="booting", progress_label="bootstrap.login", next_action="upload_files")
@@ -987,6 +989,13 @@ async def run(args: argparse.Namespace) -> int:
         analysis_round: dict[str, Any] | None = None
         analysis_action_cooldown = 0
         analysis_progress_token = ""
+        analysis_idle_rounds = 0
+        step_sleep_s = max(0.0, float(args.step_sleep_s))
+
+        def _analysis_poll_delay() -> float:
+            # --step-sleep-s is the floor (max-steps and the busy cooldown are budgeted in it); idle rounds back off above it.
+            return max(step_sleep_s, backoff_delay(analysis_idle_rounds, base_s=step_sleep_s, cap_s=4.0 * step_sleep_s))
+
         for step_no in range(1, max(1, int(args.max_steps)) + 1):
             analysis_round = await _collect_round_state(
                 client=client,
@@ -1020,6 +1029,9 @@ async def run(args: argparse.Namespace) -> int:
             if current_progress_token != analysis_progress_token:
                 analysis_progress_token = current_progress_token
                 analysis_action_cooldown = 0
+                analysis_idle_rounds = 0
+            else:
+                analysis_idle_rounds += 1
             analysis_pending_card = analysis_round["current_blocker"] if isinstance(analysis_round.get("current_blocker"), dict) else {}
             analysis_ready = _analysis_round_ready(analysis_round)
             analysis_projection_row = (
@@ -1089,32 +1101,36 @@ async def run(args: argparse.Namespace) -> int:
                         await _persist_action_sse(out_dir, step_no, f"analysis_auto_{target}", sse)
                         if is_session_busy_sse(sse):
                             analysis_action_cooldown = 5
-                    await asyncio.sleep(float(args.step_sleep_s))
+                    await asyncio.sleep(_analysis_poll_delay())
                     continue
             elif analysis_action_cooldown > 0:
                 analysis_action_cooldown -= 1
             sse = await flow.step()
             if isinstance(sse, dict):
                 await _persist_action_sse(out_dir, step_no, "analysis_step", sse)
-            await asyncio.sleep(float(args.step_sleep_s))
+            await asyncio.sleep(_analysis_poll_delay())
         else:
+            fail_matter_id = _safe_str(flow.matter_id)
+            fail_snapshot, fail_execution_snapshot, fail_execution_traces = await asyncio.gather(
+                fetch_workbench_snapshot(client, fail_matter_id) if fail_matter_id else resolved({}),
+                fetch_execution_snapshot_by_session(session_id),
+                fetch_execution_traces_by_session(session_id),
+            )
             bundle = _safe_export_failure_bundle(
                 repo_root=REPO_ROOT,
                 session_id=session_id,
-                matter_id=_safe_str(flow.matter_id),
+                matter_id=fail_matter_id,
                 reason="legal_opinion_analysis_not_ready",
             )
             bundle_quality = _safe_build_bundle_quality_reports(
                 bundle_dir=bundle["bundle_dir"],
                 flow_id="legal_opinion",
-                snapshot=await fetch_workbench_snapshot(client, _safe_str(flow.matter_id)) if _safe_str(flow.matter_id) else {},
+                snapshot=fail_snapshot,
                 current_view={},
                 goal_completion_mode="none",
             )
             write_json(out_dir / "failure_summary.json", bundle["summary"])
             write_json(out_dir / "bundle_quality.failure.json", bundle_quality)
-            fail_execution_snapshot = await fetch_execution_snapshot_by_session(session_id)
-            fail_execution_traces = await fetch_execution_traces_by_session(session_id)
             supervisor.update(
                 status="failed",
                 progress_label="terminal.failed",
@@ -1238,7 +1254,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--request-max-loops", type=int, default=24, help="chat run max_loops")
     parser.add_argument("--max-steps", type=int, default=220, help="Max steps until analysis is ready")
     parser.add_argument("--action-max-loops", type=int, default=24, help="chat run action max_loops")
-    parser.add_argument("--step-sleep-s", type=float, default=1.0, help="Sleep between analysis rounds")
+    parser.add_argument("--step-sleep-s", type=float, default=1.0, help="Minimum sleep between analysis rounds; idle rounds back off up to 4x this")
     parser.add_argument("--output-dir", default="", help="Artifacts output directory")
     return parser.parse_args()
 
@@ -20,6 +20,7 @@ ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT))
 
 from client.api_client import ApiClient
+from support.workbench.utils import extract_id
 
 load_dotenv(ROOT / ".env")
 
@@ -49,7 +50,7 @@ async def smoke_test():
             target_document_kind="legal_opinion",
             supporting_document_kinds=[],
         )
-        session_id = str((sess.get("data") or {}).get("id") or "").strip()
+        session_id = extract_id(sess)
         assert session_id, f"创建会话失败: {sess}"
         print(f"   ✓ 创建会话成功: {session_id}")
 
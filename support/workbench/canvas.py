@@ -4,14 +4,11 @@ from __future__ import annotations
 
 from typing import Any
 
-from .utils import unwrap_api_response
+from .utils import unwrap_api_dict
 
 
 def unwrap_canvas(resp: Any) -> dict[str, Any]:
-    data = unwrap_api_response(resp)
-    if isinstance(data, dict):
-        return data
-    raise AssertionError(f"unexpected canvas payload: {resp}")
+    return unwrap_api_dict(resp, what="canvas")
 
 
 def canvas_profile(canvas: dict[str, Any]) -> dict[str, Any]:
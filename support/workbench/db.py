@@ -32,7 +32,7 @@ def _pg_password() -> str:
     return os.getenv("E2E_PG_PASSWORD", "postgres")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PgTarget:
     dbname: str
     host: str = _pg_host()
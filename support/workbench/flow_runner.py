@@ -9,7 +9,7 @@ from __future__ import annotations
 import ast
 import asyncio
 import contextlib
-import json
+import hashlib
 import os
 import re
 import time
@@ -18,7 +18,7 @@ from typing import Any, Callable
 
 import httpx
 
-from .utils import trim, unwrap_api_response
+from .utils import backoff_delay, trim, unwrap_api_response, unwrap_list
 from .sse import assert_has_user_message
 
 BlockerStopFn = Callable[[dict[str, Any]], bool]
@@ -48,6 +48,11 @@ _SESSION_BUSY_EXTRA_RETRIES = _read_int_env("E2E_SESSION_BUSY_EXTRA_RETRIES", 18
 _UNANSWERABLE_CARD_MAX_REPEATS = _read_int_env("E2E_UNANSWERABLE_CARD_MAX_REPEATS", 6)
 _REPEATED_CARD_ABORT_COUNT = _read_int_env("E2E_REPEATED_CARD_ABORT_COUNT", 10)
 _CARD_RESUME_SETTLE_TIMEOUT_S = float(os.getenv("E2E_CARD_RESUME_SETTLE_TIMEOUT_S", "45") or 45)
+# Wall-clock budget for run_until (0 disables); busy-session retries do not consume steps, so max_steps alone
+# does not bound how long a run can wait.
+_RUN_UNTIL_TIMEOUT_S = float(os.getenv("E2E_FLOW_RUN_UNTIL_TIMEOUT_S", "0") or 0)
+# step() skips its session refresh when a predicate refreshed within this window (0 disables).
+_REFRESH_REUSE_WINDOW_S = float(os.getenv("E2E_FLOW_REFRESH_REUSE_WINDOW_S") or "1.0")
 
 
 def _debug(msg: str) -> None:
@@ -62,9 +67,8 @@ def _progress(msg: str) -> None:
 
 def extract_last_blocker_from_sse(sse: dict[str, Any]) -> dict[str, Any] | None:
     raw_events = sse.get("events")
-    events: list[Any] = list(raw_events) if isinstance(raw_events, list) else []
-    for idx in range(len(events) - 1, -1, -1):
-        it = events[idx]
+    events: list[Any] = raw_events if isinstance(raw_events, list) else []
+    for it in reversed(events):
         if not isinstance(it, dict):
             continue
         if it.get("event") not in {"awaiting_review", "blocked"}:
@@ -77,9 +81,8 @@ def extract_last_blocker_from_sse(sse: dict[str, Any]) -> dict[str, Any] | None:
 
 def extract_last_card_from_sse(sse: dict[str, Any]) -> dict[str, Any] | None:
     raw_events = sse.get("events")
-    events: list[Any] = list(raw_events) if isinstance(raw_events, list) else []
-    for idx in range(len(events) - 1, -1, -1):
-        it = events[idx]
+    events: list[Any] = raw_events if isinstance(raw_events, list) else []
+    for it in reversed(events):
         if not isinstance(it, dict):
             continue
         if str(it.get("event") or "").strip() != "card":
@@ -234,7 +237,7 @@ def is_session_busy_sse(sse: dict[str, Any] | None) -> bool:
     if not isinstance(sse, dict):
         return False
     raw_events = sse.get("events")
-    events: list[Any] = list(raw_events) if isinstance(raw_events, list) else []
+    events: list[Any] = raw_events if isinstance(raw_events, list) else []
     for it in events:
         if not isinstance(it, dict):
             continue
@@ -275,7 +278,7 @@ def _is_effective_resume_sse(sse: dict[str, Any] | None) -> bool:
     if not isinstance(sse, dict):
         return False
     raw_events = sse.get("events")
-    events: list[Any] = list(raw_events) if isinstance(raw_events, list) else []
+    events: list[Any] = raw_events if isinstance(raw_events, list) else []
     for it in events:
         if not isinstance(it, dict):
             continue
@@ -304,68 +307,79 @@ def _is_skill_error_confirm_card(blocker: dict[str, Any] | None) -> bool:
     )
 
 
-def _pick_recommended_or_first(options: list[Any]) -> Any | None:
-    if not isinstance(options, list) or not options:
-        return None
+_CONFIRM_POSITIVE_TOKENS = ("继续", "确认", "同意", "通过", "接受", "accept", "continue", "proceed", "yes")
+_CONFIRM_NEGATIVE_TOKENS = ("返回", "重试", "重新", "忽略", "拒绝", "取消", "reject", "deny", "no")
 
-    def _option_value(opt: Any) -> Any | None:
-        if not isinstance(opt, dict):
-            return None
-        if opt.get("value") is not None:
-            return opt.get("value")
-        # Some cards expose options as {id,label} (without value).
-        if opt.get("id") is not None:
-            return opt.get("id")
+
+def _confirm_option_value(opt: Any) -> Any | None:
+    if not isinstance(opt, dict):
         return None
+    if opt.get("value") is not None:
+        return opt.get("value")
+    # Some cards expose options as {id,label} (without value).
+    if opt.get("id") is not None:
+        return opt.get("id")
+    return None
 
-    def _option_text(opt: Any) -> str:
-        if not isinstance(opt, dict):
-            return ""
-        bits = [
-            str(opt.get("label") or ""),
-            str(opt.get("value") or ""),
-            str(opt.get("id") or ""),
-        ]
-        return " ".join(x for x in bits if x).strip().lower()
 
-    for opt in options:
-        v = _option_value(opt)
-        if isinstance(opt, dict) and opt.get("recommended") is True and v is not None:
-            return v
+def _confirm_option_text(opt: dict[str, Any]) -> str:
+    bits = [
+        str(opt.get("label") or ""),
+        str(opt.get("value") or ""),
+        str(opt.get("id") or ""),
+    ]
+    return " ".join(x for x in bits if x).strip().lower()
+
 
-    positive_tokens = ("继续", "确认", "同意", "通过", "接受", "accept", "continue", "proceed", "yes")
-    negative_tokens = ("返回", "重试", "重新", "忽略", "拒绝", "取消", "reject", "deny", "no")
+def _pick_recommended_or_first(options: list[Any]) -> Any | None:
+    """Pick by priority: recommended option, then a positive (continue/confirm) option, then the first one."""
+    if not isinstance(options, list) or not options:
+        return None
+
+    first_positive: Any | None = None
+    first_value: Any | None = None
     for opt in options:
-        v = _option_value(opt)
+        v = _confirm_option_value(opt)
         if v is None:
             continue
-        text = _option_text(opt)
-        if not text:
-            continue
-        if any(tok in text for tok in positive_tokens) and not any(tok in text for tok in negative_tokens):
+        if opt.get("recommended") is True:
             return v
-
-    for opt in options:
-        v = _option_value(opt)
-        if v is not None:
-            return v
-    return None
+        if first_value is None:
+            first_value = v
+        if first_positive is None:
+            text = _confirm_option_text(opt)
+            if (
+                text
+                and any(tok in text for tok in _CONFIRM_POSITIVE_TOKENS)
+                and not any(tok in text for tok in _CONFIRM_NEGATIVE_TOKENS)
+            ):
+                first_positive = v
+    return first_positive if first_positive is not None else first_value
+
+
+_REVIEW_SCOPE_ALIASES: dict[str, str] = {
+    token: normalized
+    for normalized, tokens in {
+        "quick": ("quick", "快速审查", "快速筛查", "quick_review"),
+        "risk": ("risk", "风险审查", "风险筛查"),
+        "redline": ("redline", "红线审查", "red_line"),
+        "full": ("full", "全面审查", "全面", "all"),
+    }.items()
+    for token in tokens
+}
+_REVIEW_SCOPE_OPTION_TOKENS: dict[str, tuple[str, ...]] = {
+    "quick": ("quick", "快速"),
+    "risk": ("risk", "风险"),
+    "redline": ("redline", "红线"),
+    "full": ("full", "全面", "all"),
+}
 
 
 def _normalize_review_scope(value: Any) -> Any:
     s = str(value or "").strip().lower()
     if not s:
         return value
-    aliases = {
-        "quick": {"quick", "快速审查", "快速筛查", "quick_review"},
-        "risk": {"risk", "风险审查", "风险筛查"},
-        "redline": {"redline", "红线审查", "red_line"},
-        "full": {"full", "全面审查", "全面", "all"},
-    }
-    for normalized, tokens in aliases.items():
-        if s in tokens:
-            return normalized
-    return value
+    return _REVIEW_SCOPE_ALIASES.get(s, value)
 
 
 def _option_answer_value(option: Any) -> Any | None:
@@ -452,19 +466,13 @@ def _coerce_review_scope_for_options(value: Any, options: list[Any] | None) -> A
     if not opts:
         return normalized
 
-    review_scope_tokens = {
-        "quick": ("quick", "快速"),
-        "risk": ("risk", "风险"),
-        "redline": ("redline", "红线"),
-        "full": ("full", "全面", "all"),
-    }
-    if normalized in review_scope_tokens:
+    if normalized in _REVIEW_SCOPE_OPTION_TOKENS:
         for opt in opts:
             picked = _option_answer_value(opt)
             if picked is None:
                 continue
             text = _option_match_text(opt)
-            if any(token in text for token in review_scope_tokens[normalized]):
+            if any(token in text for token in _REVIEW_SCOPE_OPTION_TOKENS[normalized]):
                 return picked
         return normalized
 
@@ -483,25 +491,22 @@ def _coerce_review_scope_for_options(value: Any, options: list[Any] | None) -> A
     return normalized
 
 
-def _resolve_override_value(field_key: str, overrides: dict[str, Any]) -> Any | None:
+def _flatten_overrides(overrides: dict[str, Any] | None) -> dict[str, Any]:
+    """Index overrides by field_key once per card; exact keys win over nested object overrides.
+
+    Nested object overrides are supported, e.g. overrides["profile.plaintiff"] = {"name": "..."}
+    satisfies "profile.plaintiff.name"; the first matching object (in insertion order) wins.
+    """
     if not isinstance(overrides, dict) or not overrides:
-        return None
-    if field_key in overrides:
-        return overrides[field_key]
-    # Support nested object overrides, e.g.:
-    # overrides["profile.plaintiff"] = {"name": "..."} can satisfy "profile.plaintiff.name".
+        return {}
+    flat: dict[str, Any] = dict(overrides)
     for k, v in overrides.items():
-        if not isinstance(k, str) or not k:
+        if not isinstance(k, str) or not k or not isinstance(v, dict):
             continue
-        if not isinstance(v, dict):
-            continue
-        prefix = f"{k}."
-        if not field_key.startswith(prefix):
-            continue
-        sub = field_key[len(prefix) :]
-        if sub and sub in v:
-            return v[sub]
-    return None
+        for sub, value in v.items():
+            if isinstance(sub, str) and sub:
+                flat.setdefault(f"{k}.{sub}", value)
+    return flat
 
 
 _MISSING_FIELDS_LIST_RE = re.compile(r"缺口字段[:：]\s*(\[[^\]]+\])")
@@ -610,13 +615,16 @@ def _coerce_select_value_from_semantic_hint(hint: Any, options: list[Any] | None
     return _pick_recommended_or_first(opts)
 
 
+_COURT_NAME_QUESTION_RE = re.compile("哪个|名称|管辖|受理|用于")
+
+
 def _forced_answer_from_question_text(question_text: str) -> Any | None:
     text = str(question_text or "").strip()
     if not text:
         return None
 
     # 文书起草中法院名称缺失会反复追问，这里给稳定可用的管辖法院占位答案。
-    if "法院" in text and any(tok in text for tok in ("哪个", "名称", "管辖", "受理", "用于")):
+    if "法院" in text and _COURT_NAME_QUESTION_RE.search(text):
         return "北京市海淀区人民法院"
 
     if "是否已完成所有材料上传" in text or ("完成所有材料上传" in text and "勾选" in text):
@@ -625,6 +633,24 @@ def _forced_answer_from_question_text(question_text: str) -> Any | None:
     return None
 
 
+_BOOLEAN_INPUT_TYPES = frozenset({"boolean", "bool"})
+_SINGLE_SELECT_INPUT_TYPES = frozenset({"select", "single_select", "single_choice"})
+_MULTI_SELECT_INPUT_TYPES = frozenset({"multi_select", "multiple_select"})
+_FILE_INPUT_TYPES = frozenset({"file_ids", "file_id"})
+_REVIEW_SCOPE_FIELD_KEYS = frozenset({"profile.review_scope", "review_scope"})
+
+_TEXT_SLOT_DEFAULTS: dict[str, str] = {
+    "profile.summary": "请根据已提交材料与事实生成案件摘要。",
+    "profile.facts": "已提交事实陈述与材料。",
+    "profile.claims": "请根据事实与材料整理诉讼请求/需求清单。",
+    "profile.plaintiff": "张三",
+    "profile.plaintiff.name": "张三",
+    "profile.defendant": "李四",
+    "profile.defendant.name": "李四",
+    "data.search.query": "民间借贷 借条 转账记录 聊天记录 逾期还款 利息支持 最高人民法院 民间借贷司法解释",
+}
+
+
 def auto_answer_card(
     card: dict[str, Any],
     *,
@@ -632,11 +658,12 @@ def auto_answer_card(
     uploaded_file_ids: list[str] | None = None,
 ) -> dict[str, Any]:
     """Build a resume.answers payload from a card by applying overrides + safe defaults."""
-    overrides = overrides or {}
-    uploaded_file_ids = [str(x).strip() for x in (uploaded_file_ids or []) if str(x).strip()]
-
     questions = card.get("questions")
-    questions = questions if isinstance(questions, list) else []
+    if not isinstance(questions, list) or not questions:
+        # Inferred missing fields are only answered when the card asks for them, so nothing to build.
+        return {"answers": []}
+    flat_overrides = _flatten_overrides(overrides)
+    uploaded_file_ids = [str(x).strip() for x in (uploaded_file_ids or []) if str(x).strip()]
     allowed_field_keys: set[str] = set()
 
     answers: list[dict[str, Any]] = []
@@ -673,12 +700,12 @@ def auto_answer_card(
 
         forced_value = _forced_answer_from_question_text(q_text)
         if forced_value is not None:
-            if it in {"select", "single_select", "single_choice"}:
+            if it in _SINGLE_SELECT_INPUT_TYPES:
                 forced_value = _coerce_select_value_from_semantic_hint(
                     forced_value,
                     q.get("options") if isinstance(q.get("options"), list) else [],
                 )
-            elif it in {"file_ids", "file_id"} or fk == "attachment_file_ids":
+            elif it in _FILE_INPUT_TYPES or fk == "attachment_file_ids":
                 # file_ids answers must be arrays; skip optional uploads when we do not have new file ids.
                 if isinstance(forced_value, list):
                     forced_value = [str(x).strip() for x in forced_value if str(x).strip()]
@@ -691,9 +718,9 @@ def auto_answer_card(
             _append_answer(fk, forced_value, question=q)
             continue
 
-        override_value = _resolve_override_value(fk, overrides)
+        override_value = flat_overrides.get(fk)
         if override_value is not None:
-            if fk in {"profile.review_scope", "review_scope"}:
+            if fk in _REVIEW_SCOPE_FIELD_KEYS:
                 override_value = _coerce_review_scope_for_options(
                     override_value,
                     q.get("options") if isinstance(q.get("options"), list) else [],
@@ -709,7 +736,7 @@ def auto_answer_card(
         )
 
         value: Any | None = None
-        if it in {"boolean", "bool"}:
+        if it in _BOOLEAN_INPUT_TYPES:
             if fk.endswith(".evidence_gap_stop_ask"):
                 # Do not auto-stop evidence gap follow-up in E2E; keep this gate strict.
                 value = default if has_default else False
@@ -719,16 +746,16 @@ def auto_answer_card(
                 value = default if has_default else False
             else:
                 value = default if has_default else True
-        elif it in {"select", "single_select", "single_choice"}:
+        elif it in _SINGLE_SELECT_INPUT_TYPES:
             raw_options = q.get("options")
             options: list[Any] = raw_options if isinstance(raw_options, list) else []
             value = default if has_default else _pick_recommended_or_first(options)
-            if fk in {"profile.review_scope", "review_scope"}:
+            if fk in _REVIEW_SCOPE_FIELD_KEYS:
                 value = _coerce_review_scope_for_options(
                     value,
                     options,
                 )
-        elif it in {"multi_select", "multiple_select"}:
+        elif it in _MULTI_SELECT_INPUT_TYPES:
             if has_default:
                 value = default
             elif fk == "profile.decisions.contract_review_accepted_clause_ids":
@@ -755,7 +782,7 @@ def auto_answer_card(
                 if picked is None:
                     picked = _pick_recommended_or_first(options)
                 value = [picked] if picked is not None else []
-        elif it in {"file_ids", "file_id"} or fk == "attachment_file_ids":
+        elif it in _FILE_INPUT_TYPES or fk == "attachment_file_ids":
             # Card validation in ai-engine requires attachment_file_ids to always be an array.
             if fk == "attachment_file_ids":
                 if has_default:
@@ -773,19 +800,8 @@ def auto_answer_card(
                     value = [] if required else None
         else:
             # Minimal safe defaults for common workflow profile slots.
-            if fk == "profile.summary":
-                value = "请根据已提交材料与事实生成案件摘要。"
-            elif fk == "profile.facts":
-                value = "已提交事实陈述与材料。"
-            elif fk == "profile.claims":
-                value = "请根据事实与材料整理诉讼请求/需求清单。"
-            elif fk in {"profile.plaintiff", "profile.plaintiff.name"}:
-                value = "张三"
-            elif fk in {"profile.defendant", "profile.defendant.name"}:
-                value = "李四"
-            elif fk == "data.search.query":
-                value = "民间借贷 借条 转账记录 聊天记录 逾期还款 利息支持 最高人民法院 民间借贷司法解释"
-            else:
+            value = _TEXT_SLOT_DEFAULTS.get(fk)
+            if value is None:
                 value = default if has_default else None
 
         if value is None and required:
@@ -806,7 +822,7 @@ def auto_answer_card(
                 continue
             if fk in answered:
                 continue
-            override_value = _resolve_override_value(fk, overrides)
+            override_value = flat_overrides.get(fk)
             value = override_value
             if value is None:
                 continue
@@ -831,22 +847,12 @@ def card_signature(card: dict[str, Any]) -> str:
         it = str(q.get("input_type") or q.get("question_type") or "").strip().lower()
         if fk:
             sigs.append(f"{fk}|{it}")
-    raw = json.dumps(
-        {
-            "type": interruption_type,
-            "interruption_id": interruption_id,
-            "interruption_key": interruption_key,
-            "reason_kind": reason_kind,
-            "reason_code": reason_code,
-            "questions": sigs,
-        },
-        ensure_ascii=False,
-        sort_keys=True,
+    # Only used for equality/loop detection and logs: hash a separator-joined key instead of a sorted JSON dump.
+    raw = "\x1f".join(
+        (interruption_type, interruption_id, interruption_key, reason_kind, reason_code, *sigs)
     )
     # Short hash for log readability.
-    import hashlib
-
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def _is_unanswerable_card(card: dict[str, Any]) -> bool:
@@ -892,17 +898,30 @@ def _compact_sse_events(sse: dict[str, Any] | None) -> str:
     if not isinstance(sse, dict):
         return ""
     raw_events = sse.get("events")
-    events: list[Any] = list(raw_events) if isinstance(raw_events, list) else []
-    names: list[str] = []
+    events: list[Any] = raw_events if isinstance(raw_events, list) else []
+    names: dict[str, None] = {}
     for row in events:
         if not isinstance(row, dict):
             continue
         event_name = str(row.get("event") or "").strip()
-        if not event_name:
-            continue
-        if event_name not in names:
-            names.append(event_name)
-    return ",".join(names[:8])
+        if event_name:
+            names.setdefault(event_name)
+            if len(names) == 8:
+                break
+    return ",".join(names)
+
+
+_CONTRACT_DOC_QUALITY_MARKER_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "合同审查报告法条引用不足",
+            "合同审查报告条款定位引用不足",
+            "编号建议条目过少",
+        )
+    )
+)
+_WORK_INJURY_HINT_RE = re.compile("工伤|视同工伤|赵丽珍")
 
 
 def _remediation_nudge_for_unanswerable_card(card: dict[str, Any]) -> str | None:
@@ -916,12 +935,7 @@ def _remediation_nudge_for_unanswerable_card(card: dict[str, Any]) -> str | None
     if "profile.review_scope" in s and "缺口字段" in s:
         return "补充审查范围：请基于已上传合同进行条款级法律审查，覆盖价款、违约、解除、争议解决，并输出可替换条款建议。"
 
-    contract_doc_quality_markers = (
-        "合同审查报告法条引用不足",
-        "合同审查报告条款定位引用不足",
-        "编号建议条目过少",
-    )
-    if any(m in s for m in contract_doc_quality_markers):
+    if _CONTRACT_DOC_QUALITY_MARKER_RE.search(s):
         return (
             "请重新生成合同审查意见书，并严格满足："
             "至少3处《..》第..条法条引用；"
@@ -934,7 +948,7 @@ def _remediation_nudge_for_unanswerable_card(card: dict[str, Any]) -> str | None
 
 def _remediation_nudge_for_reference_grounding(card: dict[str, Any]) -> str:
     prompt = _card_text_blob(card)
-    if any(token in prompt for token in ("工伤", "视同工伤", "赵丽珍")):
+    if _WORK_INJURY_HINT_RE.search(prompt):
         return (
             "补充检索关键词：工伤认定、视同工伤、非因工死亡、宿舍猝死、劳动关系证明、赔偿责任。"
             "请基于已上传材料继续检索可复核法条与类案。"
@@ -963,6 +977,7 @@ class WorkbenchFlow:
     _repeat_card_signature: str | None = None
     _repeat_card_count: int = 0
     _last_step_used_nudge: bool = False
+    _last_refresh_at: float = 0.0
     async def _get_workflow_snapshot(self) -> dict[str, Any] | None:
         if not self.matter_id or not hasattr(self.client, "get_workflow_snapshot"):
             return None
@@ -989,7 +1004,17 @@ class WorkbenchFlow:
         if not self.matter_id:
             return snapshot
 
-        workflow_snapshot = await self._get_workflow_snapshot()
+        # The four reads are independent; fan them out so each progress tick costs one round-trip.
+        workflow_snapshot, phase_resp, trace_resp, deliverables_resp = await asyncio.gather(
+            self._get_workflow_snapshot(),
+            self.client.get_matter_phase_timeline(self.matter_id),
+            self.client.list_traces(self.matter_id, limit=1),
+            self.client.list_deliverables(self.matter_id),
+            return_exceptions=True,
+        )
+        if isinstance(phase_resp, BaseException):
+            raise phase_resp
+
         if isinstance(workflow_snapshot, dict):
             blockers_view = _as_dict(workflow_snapshot.get("blockers_view"))
             current_blocker = _compact_blocker(blockers_view.get("current_blocker"))
@@ -997,7 +1022,6 @@ class WorkbenchFlow:
                 snapshot["current_blocker"] = current_blocker
                 snapshot["blocker_label"] = _blocker_label(current_blocker)
 
-        phase_resp = await self.client.get_matter_phase_timeline(self.matter_id)
         phase_data = unwrap_api_response(phase_resp)
         if isinstance(phase_data, dict):
             raw_phases = phase_data.get("phases")
@@ -1006,12 +1030,11 @@ class WorkbenchFlow:
             snapshot["phase_status"] = str(phase_row.get("status") or "").strip()
 
         try:
-            trace_resp = await self.client.list_traces(self.matter_id, limit=1)
-            trace_data = unwrap_api_response(trace_resp)
-            raw_traces = trace_data.get("traces") if isinstance(trace_data, dict) else None
-            traces: list[Any] = list(raw_traces) if isinstance(raw_traces, list) else []
+            if isinstance(trace_resp, BaseException):
+                raise trace_resp
+            traces = unwrap_list(trace_resp, "traces")
             if traces:
-                latest = traces[0] if isinstance(traces[0], dict) else {}
+                latest = traces[0]
                 snapshot["trace_node"] = str(
                     latest.get("node_id") or latest.get("nodeId") or latest.get("task_id") or latest.get("taskId") or ""
                 ).strip()
@@ -1020,14 +1043,10 @@ class WorkbenchFlow:
             pass
 
         try:
-            deliverables_resp = await self.client.list_deliverables(self.matter_id)
-            deliverables_data = unwrap_api_response(deliverables_resp)
-            raw_rows = deliverables_data.get("deliverables") if isinstance(deliverables_data, dict) else None
-            rows: list[Any] = list(raw_rows) if isinstance(raw_rows, list) else []
+            if isinstance(deliverables_resp, BaseException):
+                raise deliverables_resp
             output_keys: list[str] = []
-            for row in rows:
-                if not isinstance(row, dict):
-                    continue
+            for row in unwrap_list(deliverables_resp, "deliverables"):
                 key = str(row.get("output_key") or row.get("outputKey") or "").strip()
                 if key and key not in output_keys:
                     output_keys.append(key)
@@ -1118,6 +1137,7 @@ class WorkbenchFlow:
                 _debug(f"[flow] refresh session network error; keep matter_id={self.matter_id}")
                 return
             raise
+        self._last_refresh_at = time.monotonic()
         if isinstance(sess, dict):
             status = str(sess.get("status") or "").strip().lower()
             if status:
@@ -1331,11 +1351,19 @@ class WorkbenchFlow:
         stop_on_blocker: BlockerStopFn | None = None,
     ) -> dict[str, Any] | None:
         """Process one blocker if present; otherwise wait passively."""
-        await self.refresh()
+        # run_until predicates usually refresh right before step(); reuse that state instead of re-fetching.
+        if (
+            _REFRESH_REUSE_WINDOW_S > 0
+            and self.matter_id
+            and (time.monotonic() - self._last_refresh_at) < _REFRESH_REUSE_WINDOW_S
+        ):
+            card = await self.get_current_blocker()
+        else:
+            # The blocker read does not depend on the refreshed session; overlap the two round-trips.
+            _, card = await asyncio.gather(self.refresh(), self.get_current_blocker())
         if self.session_archived:
             # Avoid any chat/resume operations once the session is archived; keep run_until polling only.
             return {"events": [{"event": "session_archived"}], "output": "session archived"}
-        card = await self.get_current_blocker()
         if not card and isinstance(self.last_sse, dict):
             card = await self.actionable_blocker_from_sse(self.last_sse)
         if card:
@@ -1416,11 +1444,30 @@ class WorkbenchFlow:
         step_sleep_s: float = 0.0,
         description: str = "target condition",
         stop_on_blocker: BlockerStopFn | None = None,
+        timeout_s: float | None = None,
     ) -> None:
-        """Advance the workflow until predicate(flow) is truthy (sync/async)."""
+        """Advance the workflow until predicate(flow) is truthy (sync/async).
+
+        Fails after `max_steps` steps or, when `timeout_s` (default: E2E_FLOW_RUN_UNTIL_TIMEOUT_S) is positive,
+        once that many seconds have elapsed, whichever comes first.
+        """
+        budget_s = _RUN_UNTIL_TIMEOUT_S if timeout_s is None else float(timeout_s)
+        deadline = time.monotonic() + budget_s if budget_s > 0 else None
+
+        async def _sleep(delay_s: float) -> None:
+            if deadline is not None:
+                delay_s = min(delay_s, max(0.0, deadline - time.monotonic()))
+            await asyncio.sleep(delay_s)
+
         step_no = 0
         busy_retries = 0
+        idle_polls = 0
         while step_no < max_steps:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise AssertionError(
+                    f"Failed to reach {description} within {budget_s:.0f}s after {step_no} steps "
+                    f"(session_id={self.session_id}, matter_id={self.matter_id})"
+                )
             ok = predicate(self)
             if asyncio.iscoroutine(ok):
                 ok = await ok
@@ -1436,19 +1483,21 @@ class WorkbenchFlow:
                 stop_on_blocker=stop_on_blocker,
             )
             if sse is None:
-                await asyncio.sleep(max(_SESSION_BUSY_BACKOFF_S, 0.8))
+                await _sleep(backoff_delay(idle_polls, cap_s=max(_SESSION_BUSY_BACKOFF_S, 0.8)))
+                idle_polls += 1
                 continue
+            idle_polls = 0
             if is_session_busy_sse(sse):
                 busy_retries += 1
                 if busy_retries <= _SESSION_BUSY_EXTRA_RETRIES:
                     step_no -= 1
                     _debug(f"[flow] session busy; backoff {max(_SESSION_BUSY_BACKOFF_S, 0.5):.1f}s retry={busy_retries}")
-                    await asyncio.sleep(max(_SESSION_BUSY_BACKOFF_S, 0.5))
+                    await _sleep(max(_SESSION_BUSY_BACKOFF_S, 0.5))
                     continue
             else:
                 busy_retries = 0
             if step_sleep_s:
-                await asyncio.sleep(step_sleep_s)
+                await _sleep(step_sleep_s)
 
         raise AssertionError(f"Failed to reach {description} after {max_steps} steps (session_id={self.session_id}, matter_id={self.matter_id})")
 
@@ -1457,10 +1506,13 @@ async def wait_for_initial_blocker(flow: WorkbenchFlow, *, timeout_s: float = 60
     """Wait until the workflow produces a blocker."""
     deadline = time.time() + float(timeout_s)
     last: dict[str, Any] | None = None
+    attempt = 0
     while time.time() < deadline:
-        await flow.refresh()
-        last = await flow.get_current_blocker()
+        _, last = await asyncio.gather(flow.refresh(), flow.get_current_blocker())
         if last:
             return last
-        await asyncio.sleep(1.0)
+        # The kickoff card usually lands within a second; poll fast first and back off to 1s.
+        delay = backoff_delay(attempt, base_s=0.1, cap_s=1.0)
+        attempt += 1
+        await asyncio.sleep(max(0.0, min(delay, deadline - time.time())))
     raise AssertionError(f"Timed out waiting for initial blocker (timeout={timeout_s}s, session_id={flow.session_id})")
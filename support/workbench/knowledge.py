@@ -6,7 +6,7 @@ import asyncio
 import time
 from typing import Any
 
-from .utils import unwrap_api_response
+from .utils import backoff_delay, unwrap_api_dict
 
 
 async def ingest_doc(
@@ -28,10 +28,7 @@ async def ingest_doc(
         "overwrite": bool(overwrite),
     }
     resp = await client.post("/knowledge-service/api/v1/internal/knowledge/ingest", payload)
-    data = unwrap_api_response(resp)
-    if not isinstance(data, dict):
-        raise AssertionError(f"knowledge ingest returned unexpected payload: {resp}")
-    return data
+    return unwrap_api_dict(resp, what="knowledge ingest")
 
 
 async def search(
@@ -51,10 +48,7 @@ async def search(
         "include_metadata": bool(include_metadata),
     }
     resp = await client.post("/knowledge-service/api/v1/internal/knowledge/search", payload)
-    data = unwrap_api_response(resp)
-    if not isinstance(data, dict):
-        raise AssertionError(f"knowledge search returned unexpected payload: {resp}")
-    return data
+    return unwrap_api_dict(resp, what="knowledge search")
 
 
 async def wait_for_search_hit(
@@ -69,11 +63,15 @@ async def wait_for_search_hit(
     want = str(must_file_id).strip()
     deadline = time.time() + float(timeout_s)
     last: dict[str, Any] | None = None
+    attempt = 0
     while time.time() < deadline:
         last = await search(client, query=query, kb_ids=kb_ids, top_k=10, include_content=False, include_metadata=True)
         results = last.get("results") if isinstance(last.get("results"), list) else []
         for it in results:
             if isinstance(it, dict) and str(it.get("file_id") or "").strip() == want:
                 return last
-        await asyncio.sleep(float(interval_s))
+        # Indexing usually lands quickly; start with short polls and back off towards interval_s.
+        delay = backoff_delay(attempt, base_s=min(0.5, float(interval_s)), cap_s=float(interval_s))
+        attempt += 1
+        await asyncio.sleep(max(0.0, min(delay, deadline - time.time())))
     raise AssertionError(f"Timed out waiting for knowledge search hit: file_id={want}. Last={last}")
@@ -11,7 +11,7 @@ import hashlib
 import time
 from typing import Any, Iterable
 
-from .utils import unwrap_api_response
+from .utils import backoff_delay, unwrap_api_response
 
 
 async def list_case_facts(
@@ -117,28 +117,66 @@ def assert_any_fact_content_contains(
     )
 
 
-async def wait_for_entity_keys(
+def _missing_fragments(facts: list[dict[str, Any]], fragments: list[str]) -> list[str]:
+    if not fragments:
+        return []
+    hay = "\n".join(str(it.get("content") or "") for it in facts if isinstance(it, dict))
+    return [x for x in fragments if x not in hay]
+
+
+async def _poll_case_facts(
     client,
     *,
     user_id: int,
     case_id: str,
-    must_include: Iterable[str],
-    timeout_s: float = 90.0,
-    interval_s: float = 2.0,
-) -> list[dict[str, Any]]:
-    want = {str(x).strip() for x in must_include if str(x).strip()}
+    want_keys: set[str],
+    want_fragments: list[str],
+    timeout_s: float,
+    interval_s: float,
+) -> tuple[bool, list[dict[str, Any]], set[str]]:
+    """Fetch case facts once per tick and evaluate key/content requirements locally."""
     deadline = time.time() + float(timeout_s)
     last_keys: set[str] = set()
     last_facts: list[dict[str, Any]] = []
+    attempt = 0
 
     while time.time() < deadline:
         last_facts = await list_case_facts(
             client, user_id=user_id, case_id=case_id, limit=300
         )
         last_keys = entity_keys(last_facts)
-        if want.issubset(last_keys):
-            return last_facts
-        await asyncio.sleep(float(interval_s))
+        # Only build the content haystack once the cheaper key check passes.
+        if want_keys.issubset(last_keys) and not _missing_fragments(last_facts, want_fragments):
+            return True, last_facts, last_keys
+        # Facts usually materialise within a few seconds; start with short polls and back off towards interval_s.
+        delay = backoff_delay(attempt, base_s=min(0.5, float(interval_s)), cap_s=float(interval_s))
+        attempt += 1
+        await asyncio.sleep(max(0.0, min(delay, deadline - time.time())))
+
+    return False, last_facts, last_keys
+
+
+async def wait_for_entity_keys(
+    client,
+    *,
+    user_id: int,
+    case_id: str,
+    must_include: Iterable[str],
+    timeout_s: float = 90.0,
+    interval_s: float = 2.0,
+) -> list[dict[str, Any]]:
+    want = {str(x).strip() for x in must_include if str(x).strip()}
+    ok, last_facts, last_keys = await _poll_case_facts(
+        client,
+        user_id=user_id,
+        case_id=case_id,
+        want_keys=want,
+        want_fragments=[],
+        timeout_s=timeout_s,
+        interval_s=interval_s,
+    )
+    if ok:
+        return last_facts
 
     missing = sorted(want - last_keys)
     raise AssertionError(
@@ -170,37 +208,20 @@ async def wait_for_memory_facts(
         str(x).strip() for x in (must_include_content or []) if str(x).strip()
     ]
 
-    deadline = time.time() + float(timeout_s)
-    last_keys: set[str] = set()
-    last_facts: list[dict[str, Any]] = []
-
-    while time.time() < deadline:
-        last_facts = await list_case_facts(
-            client, user_id=user_id, case_id=case_id, limit=300
-        )
-        last_keys = entity_keys(last_facts)
-
-        ok_keys = want_keys.issubset(last_keys) if want_keys else True
-
-        hay = "\n".join(
-            [str(it.get("content") or "") for it in last_facts if isinstance(it, dict)]
-        )
-        ok_content = (
-            all(frag in hay for frag in want_fragments) if want_fragments else True
-        )
-
-        if ok_keys and ok_content:
-            return last_facts
-        await asyncio.sleep(float(interval_s))
+    ok, last_facts, last_keys = await _poll_case_facts(
+        client,
+        user_id=user_id,
+        case_id=case_id,
+        want_keys=want_keys,
+        want_fragments=want_fragments,
+        timeout_s=timeout_s,
+        interval_s=interval_s,
+    )
+    if ok:
+        return last_facts
 
     missing_keys = sorted(want_keys - last_keys)
-    missing_fragments = []
-    if want_fragments:
-        hay = "\n".join(
-            [str(it.get("content") or "") for it in last_facts if isinstance(it, dict)]
-        )
-        missing_fragments = [x for x in want_fragments if x not in hay]
-
+    missing_fragments = _missing_fragments(last_facts, want_fragments)
     raise AssertionError(
         "Timed out waiting for memory facts. "
         f"MissingKeys={missing_keys} MissingFragments={missing_fragments} GotKeys={sorted(last_keys)[:50]}"
@@ -4,14 +4,11 @@ from __future__ import annotations
 
 from typing import Any, Iterable
 
-from .utils import unwrap_api_response
+from .utils import unwrap_api_dict
 
 
 def unwrap_phase_timeline(resp: Any) -> dict[str, Any]:
-    data = unwrap_api_response(resp)
-    if isinstance(data, dict):
-        return data
-    raise AssertionError(f"unexpected phase timeline payload: {resp}")
+    return unwrap_api_dict(resp, what="phase timeline")
 
 
 def phases(phase_tl: dict[str, Any]) -> list[dict[str, Any]]:
@@ -57,11 +54,14 @@ def deliverable_output_keys(phase_tl: dict[str, Any]) -> set[str]:
 
 
 def assert_has_phases(phase_tl: dict[str, Any], *, must_include: Iterable[str]) -> None:
-    have = set(phase_ids(phase_tl))
-    want = {str(x).strip() for x in must_include if str(x).strip()}
-    missing = sorted(want - have)
+    missing = {str(x).strip() for x in must_include if str(x).strip()}
+    # Drain the wanted set while walking phases; the full id set is only built for the failure message.
+    for p in phases(phase_tl):
+        if not missing:
+            return
+        missing.discard(str(p.get("id") or "").strip())
     if missing:
-        raise AssertionError(f"phase_timeline missing phases={missing}. Have={sorted(have)}")
+        raise AssertionError(f"phase_timeline missing phases={sorted(missing)}. Have={sorted(set(phase_ids(phase_tl)))}")
 
 
 def assert_phase_status_in(phase_tl: dict[str, Any], *, phase_id: str, allowed: Iterable[str]) -> None:
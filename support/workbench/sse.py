@@ -8,7 +8,7 @@ LLM-generated text is asserted via "contains" only when needed.
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
 
 def _events(sse: dict[str, Any]) -> list[dict[str, Any]]:
@@ -27,22 +27,30 @@ def event_types(sse: dict[str, Any]) -> list[str]:
     return out
 
 
-def events_of_type(sse: dict[str, Any], event: str) -> list[dict[str, Any]]:
+def _iter_event_data(sse: dict[str, Any], event: str, *, newest_first: bool = False) -> Iterator[dict[str, Any]]:
+    """Lazily yield the data of `event` events, so callers that need one match stop at it."""
     want = str(event or "").strip()
-    if not want:
-        return []
-    out: list[dict[str, Any]] = []
-    for it in _events(sse):
-        if it.get("event") != want:
+    evts = sse.get("events") if isinstance(sse, dict) else None
+    if not want or not isinstance(evts, list):
+        return
+    for it in reversed(evts) if newest_first else evts:
+        if not isinstance(it, dict) or it.get("event") != want:
             continue
         data = it.get("data")
-        out.append(data if isinstance(data, dict) else {"data": data})
-    return out
+        yield data if isinstance(data, dict) else {"data": data}
+
+
+def events_of_type(sse: dict[str, Any], event: str) -> list[dict[str, Any]]:
+    return list(_iter_event_data(sse, event))
+
+
+def _has_event(sse: dict[str, Any], event: str) -> bool:
+    return next(_iter_event_data(sse, event), None) is not None
 
 
 def last_event_data(sse: dict[str, Any], event: str) -> dict[str, Any] | None:
-    for it in reversed(events_of_type(sse, event)):
-        if isinstance(it, dict) and it:
+    for it in _iter_event_data(sse, event, newest_first=True):
+        if it:
             return it
     return None
 
@@ -63,10 +71,7 @@ def _has_partial_stream_error(sse: dict[str, Any]) -> bool:
     ApiClient records these as an `error` event with `partial: True` so tests can continue by polling state.
     Treat it as a non-fatal stream end signal.
     """
-    for e in events_of_type(sse, "error"):
-        if isinstance(e, dict) and e.get("partial") is True:
-            return True
-    return False
+    return any(e.get("partial") is True for e in _iter_event_data(sse, "error"))
 
 
 def _is_busy_like_partial_stream(sse: dict[str, Any]) -> bool:
@@ -175,7 +180,7 @@ def assert_no_error(sse: dict[str, Any]) -> None:
 
 
 def assert_has_end(sse: dict[str, Any]) -> None:
-    if not (events_of_type(sse, "end") or events_of_type(sse, "complete") or _has_partial_stream_error(sse)):
+    if not (_has_event(sse, "end") or _has_event(sse, "complete") or _has_partial_stream_error(sse)):
         raise AssertionError(f"SSE missing end/complete. Event types={event_types(sse)}")
 
 
@@ -220,11 +225,10 @@ def assert_visible_response(sse: dict[str, Any], *, output_must_contain: Iterabl
 
 def assert_has_user_message(sse: dict[str, Any], *, content_must_contain: Iterable[str] | None = None) -> None:
     """Resume streams should echo a readable user message so the UI doesn't look like 'nothing was sent'."""
-    msgs = events_of_type(sse, "user_message")
-    if not msgs:
+    last = next(_iter_event_data(sse, "user_message", newest_first=True), None)
+    if last is None:
         raise AssertionError(f"SSE missing user_message. Event types={event_types(sse)}")
-    last = msgs[-1] if msgs else {}
-    content = str((last or {}).get("content") or "").strip()
+    content = str(last.get("content") or "").strip()
     if not content:
         raise AssertionError(f"SSE user_message missing content: {last}")
 
@@ -14,14 +14,11 @@ from __future__ import annotations
 
 from typing import Any, Iterable
 
-from .utils import unwrap_api_response
+from .utils import unwrap_api_dict
 
 
 def unwrap_timeline(resp: Any) -> dict[str, Any]:
-    data = unwrap_api_response(resp)
-    if isinstance(data, dict):
-        return data
-    raise AssertionError(f"unexpected timeline payload: {resp}")
+    return unwrap_api_dict(resp, what="timeline")
 
 
 def rounds(timeline: dict[str, Any]) -> list[dict[str, Any]]:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import time
 from typing import Any, Callable
 
@@ -14,6 +15,42 @@ def unwrap_api_response(resp: Any) -> Any:
     return resp
 
 
+def unwrap_api_dict(resp: Any, *, what: str) -> dict[str, Any]:
+    """Return `unwrap_api_response(resp)` when it is a dict; raise AssertionError naming `what` otherwise."""
+    data = unwrap_api_response(resp)
+    if isinstance(data, dict):
+        return data
+    raise AssertionError(f"unexpected {what} payload: {resp}")
+
+
+def unwrap_list(resp: Any, key: str) -> list[dict[str, Any]]:
+    """Return the dict rows of `unwrap_api_response(resp)[key]`, or [] for any other shape."""
+    data = unwrap_api_response(resp)
+    rows = data.get(key) if isinstance(data, dict) else None
+    if not isinstance(rows, list):
+        return []
+    return [row for row in rows if isinstance(row, dict)]
+
+
+def extract_id(resp: Any, *, key: str = "id") -> str:
+    """Return `resp["data"][key]` as a stripped string, or "" for any other shape."""
+    data = resp.get("data") if isinstance(resp, dict) else None
+    if not isinstance(data, dict):
+        return ""
+    return str(data.get(key) or "").strip()
+
+
+def backoff_delay(attempt: int, *, base_s: float = 0.2, cap_s: float = 2.0, jitter: float = 0.2) -> float:
+    """Exponential backoff delay for the `attempt`-th poll (0-based), capped and jittered by +/-`jitter`."""
+    delay = min(float(cap_s), float(base_s) * (2 ** min(max(int(attempt), 0), 32)))
+    return delay * random.uniform(1.0 - float(jitter), 1.0 + float(jitter))
+
+
+async def resolved(value: Any) -> Any:
+    """Awaitable that returns `value`, for skipped slots in an `asyncio.gather(...)` fan-out."""
+    return value
+
+
 async def eventually(
     fn: Callable[[], Any],
     *,
@@ -23,17 +60,20 @@ async def eventually(
 ) -> Any:
     """Poll `fn` until it returns a truthy value or timeout.
 
-    `fn` can be sync or async.
+    `fn` can be sync or async. Polls back off exponentially from 0.2s up to `interval_s`.
     """
     deadline = time.time() + float(timeout_s)
     last: Any = None
+    attempt = 0
     while time.time() < deadline:
         last = fn()
         if asyncio.iscoroutine(last):
             last = await last
         if last:
             return last
-        await asyncio.sleep(float(interval_s))
+        delay = backoff_delay(attempt, base_s=min(0.2, float(interval_s)), cap_s=float(interval_s))
+        attempt += 1
+        await asyncio.sleep(max(0.0, min(delay, deadline - time.time())))
     raise AssertionError(f"Timed out waiting for {description} (timeout={timeout_s}s). Last={last!r}")
 
 
@@ -44,16 +44,56 @@ class _AsyncClient:
 async def test_login_uses_auth_service_gateway_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("E2E_HTTP_LOGIN_RETRIES", "1")
     monkeypatch.setenv("E2E_HTTP_GET_RETRIES", "1")
+    # Direct-service mode short-circuits login; script tests may leave it configured.
+    monkeypatch.delenv("E2E_DIRECT_USER_ID", raising=False)
+    monkeypatch.delenv("E2E_DIRECT_ORG_ID", raising=False)
     client = ApiClient("http://127.0.0.1:18080/api/v1")
     fake = _AsyncClient()
     client._client = fake  # type: ignore[assignment]
 
     await client.login("admin", "admin123456")
 
-    assert fake.calls[0][1] == "http://127.0.0.1:18080/api/v1/auth-service/auth/login"
+    method, url, kwargs = fake.calls[0]
+    assert (method, url) == ("POST", "http://127.0.0.1:18080/api/v1/auth-service/auth/login")
+    assert kwargs["headers"] == {"Content-Type": "application/x-www-form-urlencoded"}
+    assert kwargs["data"] == {"username": "admin", "password": "admin123456"}
 
 
 def test_submitted_ack_uses_message_type_specific_event_names() -> None:
     assert _submitted_ack("resume") == ("resume_submitted", "resume submitted")
     assert _submitted_ack("input") == ("input_submitted", "input submitted")
     assert _submitted_ack("chat") == ("chat_submitted", "chat submitted")
+
+
+class _UploadClient:
+    def __init__(self, statuses: list[int]) -> None:
+        self.statuses = statuses
+        self.files: list[tuple[str, bytes]] = []
+
+    async def post(self, url: str, **kwargs):  # type: ignore[no-untyped-def]
+        self.files.append(kwargs["files"]["file"])
+        resp = _Response({"code": 0, "message": "OK", "data": {"id": "file-1"}})
+        resp.status_code = self.statuses.pop(0)
+        return resp
+
+
+async def _no_sleep(_delay: float) -> None:
+    return None
+
+
+@pytest.mark.asyncio
+async def test_upload_file_reads_once_and_resends_bytes_on_retry(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("E2E_HTTP_UPLOAD_RETRIES", "2")
+    monkeypatch.setattr("client.api_client.asyncio.sleep", _no_sleep)
+    evidence = tmp_path / "合同.txt"
+    evidence.write_bytes("借款合同".encode("utf-8"))
+    client = ApiClient("http://127.0.0.1:18080/api/v1")
+    fake = _UploadClient([503, 200])
+    client._client = fake  # type: ignore[assignment]
+
+    resp = await client.upload_file(str(evidence))
+
+    assert resp["data"]["id"] == "file-1"
+    assert fake.files == [("合同.txt", "借款合同".encode("utf-8"))] * 2
+    with pytest.raises(FileNotFoundError):
+        await client.upload_file(str(tmp_path / "missing.txt"))
@@ -5,6 +5,7 @@ import pytest
 
 from scripts._support.run_status import (
     RunStatusSupervisor,
+    _latest_trace_progress,
     format_run_status_line,
     resolve_status_path,
 )
@@ -196,3 +197,20 @@ def test_run_status_fails_when_workflow_missing_current_phase(tmp_path) -> None:
                 },
             ],
         )
+
+
+def test_latest_trace_progress_reports_newest_completed_phase() -> None:
+    progress = _latest_trace_progress(
+        [
+            {"node_id": "program:intake", "status": "completed"},
+            {"node_id": "program:facts", "phase": "facts_review", "status": "completed"},
+            {"node_id": "program:notes", "phase": "", "status": "completed"},
+            {"node_id": "program:analysis", "node_name": "analysis", "status": "running"},
+            {"node_id": "program:drafting", "status": "blocked"},
+        ]
+    )
+
+    assert progress["last_completed_phase"] == "notes"
+    assert progress["current_task_id"] == "program:analysis"
+    assert progress["current_node"] == "analysis"
+    assert _latest_trace_progress(None)["last_completed_phase"] == ""
@@ -22,3 +22,74 @@ def test_configure_direct_service_mode_uses_lane_local_ports(monkeypatch) -> Non
     assert config["consultations_base_url"] == "http://127.0.0.1:18027/api/v1"
     assert config["matter_base_url"] == "http://127.0.0.1:18026/api/v1"
     assert config["templates_base_url"] == "http://127.0.0.1:18025/api/v1"
+
+
+async def test_execution_reads_reuse_shared_ai_engine_client(monkeypatch) -> None:
+    import httpx
+
+    from scripts._support import workflow_real_flow_support as support
+
+    seen: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path.endswith("/snapshot"):
+            return httpx.Response(200, json={"code": 0, "data": {"status": "running"}})
+        return httpx.Response(200, json={"code": 0, "data": {"traces": [{"node_id": "memory"}]}})
+
+    monkeypatch.setattr(support, "_candidate_ai_engine_base_urls", lambda: ("http://ai-engine.test",))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as shared:
+        token = support._AI_ENGINE_HTTP.set(shared)
+        try:
+            snapshot = await support.fetch_execution_snapshot_by_session("s-1")
+            traces = await support.fetch_execution_traces_by_session("s-1", limit=5)
+        finally:
+            support._AI_ENGINE_HTTP.reset(token)
+        assert not shared.is_closed
+
+    assert snapshot == {"status": "running"}
+    assert traces == [{"node_id": "memory"}]
+    assert seen == [
+        "/api/v1/internal/executions/by-thread/session:s-1/snapshot",
+        "/api/v1/internal/executions/by-thread/session:s-1/traces",
+    ]
+
+
+async def test_upload_consultation_files_keeps_input_order(tmp_path) -> None:
+    import asyncio
+
+    from scripts._support.workflow_real_flow_support import upload_consultation_files
+
+    paths = [tmp_path / "a.txt", tmp_path / "missing.txt", tmp_path / "b.txt"]
+    paths[0].write_text("a", encoding="utf-8")
+    paths[2].write_text("b", encoding="utf-8")
+
+    class _Client:
+        async def upload_file(self, file_path: str, purpose: str = "consultation") -> dict:
+            # Finish the first upload last to prove results are not completion-ordered.
+            await asyncio.sleep(0.02 if file_path.endswith("a.txt") else 0)
+            return {"code": 0, "data": {"id": f"id-{file_path.rsplit('/', 1)[-1]}"}}
+
+    assert await upload_consultation_files(_Client(), paths) == ["id-a.txt", "id-b.txt"]
+
+
+async def test_upload_consultation_files_bounds_concurrent_uploads(tmp_path) -> None:
+    import asyncio
+
+    from scripts._support import workflow_real_flow_support as support
+
+    paths = [tmp_path / f"{idx}.txt" for idx in range(support._UPLOAD_CONCURRENCY * 2 + 1)]
+    for path in paths:
+        path.write_text("x", encoding="utf-8")
+    in_flight = {"now": 0, "peak": 0}
+
+    class _Client:
+        async def upload_file(self, file_path: str, purpose: str = "consultation") -> dict:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return {"code": 0, "data": {"id": file_path}}
+
+    assert await support.upload_consultation_files(_Client(), paths) == [str(path) for path in paths]
+    assert in_flight["peak"] == support._UPLOAD_CONCURRENCY
@@ -16,14 +16,13 @@ CONTRACT_TYPE_IDS = (
     "franchise",
     "other",
 )
+FIXTURE_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "workbench" / "contract_review"
 
 
 def test_contract_review_fixture_matrix_covers_all_contract_types() -> None:
-    root = Path(__file__).resolve().parents[2] / "fixtures" / "workbench" / "contract_review"
-
     for contract_type_id in CONTRACT_TYPE_IDS:
-        fixture_path = root / f"{contract_type_id}.txt"
-        expectation_path = root / f"{contract_type_id}.expectation.json"
+        fixture_path = FIXTURE_DIR / f"{contract_type_id}.txt"
+        expectation_path = FIXTURE_DIR / f"{contract_type_id}.expectation.json"
 
         assert fixture_path.is_file(), contract_type_id
         assert expectation_path.is_file(), contract_type_id
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import io
+import re
+import zipfile
+
+import pytest
+
+from support.workbench.docx import (
+    _alternation,
+    assert_docx_contains,
+    assert_docx_has_no_template_placeholders,
+    extract_docx_text,
+    fetch_docx,
+    load_docx,
+    score_contract_review_docx_benchmark,
+)
+
+pytestmark = pytest.mark.skip_seed_bootstrap
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _docx_bytes(parts: dict[str, str]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("[Content_Types].xml", "<Types/>")
+        for name, body in parts.items():
+            z.writestr(name, f'<w:document xmlns:w="{_W_NS}"><w:body>{body}</w:body></w:document>')
+    return buf.getvalue()
+
+
+def test_extract_docx_text_reads_body_and_header_paragraphs() -> None:
+    raw = _docx_bytes(
+        {
+            "word/document.xml": "<w:p><w:r><w:t>法律</w:t></w:r><w:r><w:tab/><w:t>意见书</w:t></w:r></w:p>"
+            "<w:p><w:r><w:t>第一段</w:t><w:br/><w:t>续行</w:t></w:r></w:p>",
+            "word/header1.xml": "<w:p><w:r><w:t>页眉</w:t></w:r></w:p>",
+            "word/media/ignored.xml": "<w:p><w:r><w:t>不应出现</w:t></w:r></w:p>",
+        }
+    )
+
+    text = extract_docx_text(raw)
+
+    assert text.splitlines() == ["法律\t意见书", "第一段", "续行", "页眉"]
+
+
+def test_extract_docx_text_accepts_preloaded_parts() -> None:
+    raw = _docx_bytes({"word/document.xml": "<w:p><w:r><w:t>审查报告</w:t></w:r></w:p>"})
+
+    parts = load_docx(raw)
+
+    assert list(parts) == ["word/document.xml"]
+    assert extract_docx_text(parts) == extract_docx_text(raw) == "审查报告"
+
+
+def test_extract_docx_text_returns_empty_for_invalid_payload() -> None:
+    assert extract_docx_text(b"not a zip") == ""
+    assert extract_docx_text(b"") == ""
+    assert load_docx(b"not a zip") == {}
+
+
+class _StreamingClient:
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+        self.requested: list[str] = []
+
+    async def download_file_stream(self, file_id: str):  # type: ignore[no-untyped-def]
+        self.requested.append(file_id)
+        for idx in range(0, len(self.payload), 7):
+            yield self.payload[idx : idx + 7]
+
+
+@pytest.mark.asyncio
+async def test_fetch_docx_spools_streamed_chunks() -> None:
+    raw = _docx_bytes({"word/document.xml": "<w:p><w:r><w:t>流式下载</w:t></w:r></w:p>"})
+    client = _StreamingClient(raw)
+
+    parts = await fetch_docx(client, "file-1", spool_max_bytes=16)
+
+    assert client.requested == ["file-1"]
+    assert extract_docx_text(parts) == "流式下载"
+
+
+def test_assert_docx_contains_reports_each_missing_fragment_once() -> None:
+    assert_docx_contains("原告张三E2E01诉被告李四", must_include=["张三", "张三E2E01", "", "李四"])
+
+    with pytest.raises(AssertionError, match=r"\['王五'\]"):
+        assert_docx_contains("原告张三", must_include=["张三", "王五", "王五"])
+
+
+def test_contract_review_benchmark_matches_section_variants_in_one_scan() -> None:
+    text = "合同审查报告\n主要法律依据\n审查范围\n问题及建议\n声明\n某某律师事务所 2024年5月1日"
+
+    result = score_contract_review_docx_benchmark(text, gold_text=text)
+
+    assert all(result.section_hits.values()), result.section_hits
+    missing_date = score_contract_review_docx_benchmark(text.replace("2024年5月1日", ""), gold_text=text)
+    assert missing_date.section_hits["signature"] is False
+
+
+
+def test_section_alternation_keeps_shared_flags_and_rejects_mixed_ones() -> None:
+    folded = _alternation((re.compile("审查内容", re.IGNORECASE), re.compile("summary", re.IGNORECASE)))
+
+    assert folded.search("SUMMARY") is not None
+    with pytest.raises(ValueError, match="share regex flags"):
+        _alternation((re.compile("a"), re.compile("b", re.IGNORECASE)))
+
+def test_assert_docx_has_no_template_placeholders_lists_each_delimiter_once() -> None:
+    assert_docx_has_no_template_placeholders("百分比 50% 与 {括号}")
+
+    with pytest.raises(AssertionError, match=r"\['\{\{', '\}\}', '%\}'\]"):
+        assert_docx_has_no_template_placeholders("{{ name }} 与 {{ date }} 以及 %}")
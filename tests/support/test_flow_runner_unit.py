@@ -6,8 +6,14 @@ import pytest
 
 from support.workbench.flow_runner import (
     WorkbenchFlow,
+    _compact_sse_events,
+    _forced_answer_from_question_text,
+    _pick_recommended_or_first,
     auto_answer_card,
     card_signature,
+    extract_last_blocker_from_sse,
+    extract_last_card_from_sse,
+    wait_for_initial_blocker,
 )
 
 pytestmark = pytest.mark.skip_seed_bootstrap
@@ -168,6 +174,21 @@ def test_auto_answer_card_selects_all_recommended_contract_review_clauses() -> N
     assert answers["data.work_product.regenerate_documents"] is True
 
 
+def test_pick_recommended_or_first_prefers_recommended_then_positive_then_first() -> None:
+    options = [
+        {"label": "返回修改", "value": "back"},
+        {"label": "继续生成", "value": "go"},
+        "junk",
+        {"label": "其他", "id": "other", "recommended": True},
+    ]
+
+    assert _pick_recommended_or_first(options) == "other"
+    assert _pick_recommended_or_first(options[:3]) == "go"
+    assert _pick_recommended_or_first([{"label": "取消继续", "value": "x"}, {"label": "稍后", "value": "y"}]) == "x"
+    assert _pick_recommended_or_first([{"label": "无值"}]) is None
+    assert _pick_recommended_or_first([]) is None
+
+
 @pytest.mark.asyncio
 async def test_step_strict_card_mode_skips_hidden_remediation_nudge() -> None:
     card = {
@@ -653,3 +674,169 @@ async def test_step_resumes_blocker_from_last_sse_when_blocker_poll_is_empty() -
 
     assert isinstance(result, dict)
     assert result.get("current_blocker") == current_blocker
+
+
+@pytest.mark.asyncio
+async def test_step_reuses_refresh_done_by_predicate_just_before() -> None:
+    class _Client:
+        def __init__(self) -> None:
+            self.session_calls = 0
+
+        async def get_session(self, session_id: str) -> dict[str, object]:
+            self.session_calls += 1
+            return {"code": 0, "data": {"id": session_id, "status": "active", "matter_id": "m-1"}}
+
+        async def get_blocker(self, session_id: str) -> dict[str, object]:
+            return {"code": 0, "data": None}
+
+    client = _Client()
+    flow = WorkbenchFlow(client=client, session_id="session-1")
+
+    await flow.refresh()
+    assert await flow.step() is None
+    assert client.session_calls == 1
+    assert flow.matter_id == "m-1"
+
+    flow._last_refresh_at = 0.0
+    assert await flow.step() is None
+    assert client.session_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_run_until_fails_once_wall_clock_budget_is_spent() -> None:
+    flow = WorkbenchFlow(client=object(), session_id="session-1")
+    steps = {"n": 0}
+
+    async def _step(**kwargs):  # type: ignore[no-untyped-def]
+        steps["n"] += 1
+        await asyncio.sleep(0.02)
+        # Busy rounds are retried without consuming steps, so only the wall-clock budget stops this loop.
+        return {"events": [{"event": "session_busy"}], "output": ""}
+
+    flow.step = _step  # type: ignore[method-assign]
+
+    with pytest.raises(AssertionError, match=r"Failed to reach deliverable within 0s"):
+        await flow.run_until(lambda f: False, max_steps=1, description="deliverable", timeout_s=0.1)
+    assert steps["n"] >= 1
+
+
+def test_card_signature_is_stable_and_tracks_questions() -> None:
+    card = {
+        "type": "ask_user",
+        "interruption_id": "int-1",
+        "questions": [{"field_key": "profile.client_role", "input_type": "Select"}, "noise"],
+    }
+
+    sig = card_signature(card)
+
+    assert sig == card_signature(dict(card)) and len(sig) == 16
+    assert sig != card_signature({**card, "questions": [{"field_key": "profile.client_role", "input_type": "text"}]})
+    assert sig != card_signature({**card, "interruption_id": "int-2"})
+
+
+@pytest.mark.asyncio
+async def test_wait_for_initial_blocker_polls_fast_before_backing_off() -> None:
+    flow = WorkbenchFlow(client=object(), session_id="session-1")
+    card = {"type": "ask_user", "interruption_id": "kickoff"}
+    calls = {"n": 0}
+
+    async def _refresh() -> None:
+        return None
+
+    async def _get_current_blocker() -> dict[str, object] | None:
+        calls["n"] += 1
+        return card if calls["n"] >= 3 else None
+
+    flow.refresh = _refresh  # type: ignore[method-assign]
+    flow.get_current_blocker = _get_current_blocker  # type: ignore[method-assign]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert await wait_for_initial_blocker(flow, timeout_s=10.0) == card
+    assert calls["n"] == 3
+    assert loop.time() - started < 1.0
+
+
+def test_forced_answer_fills_court_name_questions_only() -> None:
+    assert _forced_answer_from_question_text("请填写受理法院名称") == "北京市海淀区人民法院"
+    assert _forced_answer_from_question_text("用于起诉的法院") == "北京市海淀区人民法院"
+    assert _forced_answer_from_question_text("法院判决结果") is None
+    assert _forced_answer_from_question_text("是否已完成所有材料上传") is True
+
+
+def test_auto_answer_card_fills_text_slot_defaults() -> None:
+    card = {
+        "questions": [
+            {"field_key": "profile.plaintiff.name", "input_type": "text", "required": True, "default": "王五"},
+            {"field_key": "profile.summary", "input_type": "textarea", "required": True},
+            {"field_key": "profile.other", "input_type": "text", "default": "保留默认"},
+            {"field_key": "profile.optional", "input_type": "text"},
+        ]
+    }
+
+    answers = auto_answer_card(card)["answers"]
+
+    assert answers == [
+        {"field_key": "profile.plaintiff.name", "value": "张三"},
+        {"field_key": "profile.summary", "value": "请根据已提交材料与事实生成案件摘要。"},
+        {"field_key": "profile.other", "value": "保留默认"},
+    ]
+
+
+def test_sse_scanners_read_events_in_place() -> None:
+    events = [
+        {"event": "card", "data": {"id": "c1"}},
+        {"event": "blocked", "data": {"id": "b1"}},
+        "noise",
+        {"event": "card", "data": {}},
+        {"event": "awaiting_review", "data": {"id": "b2"}},
+        *({"event": f"e{idx}"} for idx in range(10)),
+    ]
+    sse = {"events": events}
+
+    assert extract_last_card_from_sse(sse) == {"id": "c1"}
+    assert extract_last_blocker_from_sse(sse) == {"id": "b2"}
+    assert _compact_sse_events(sse) == "card,blocked,awaiting_review,e0,e1,e2,e3,e4"
+    assert len(events) == 15
+
+
+@pytest.mark.asyncio
+async def test_wait_for_initial_blocker_overlaps_refresh_and_blocker_reads() -> None:
+    flow = WorkbenchFlow(client=object(), session_id="session-1")
+    order: list[str] = []
+
+    async def _refresh() -> None:
+        order.append("refresh:start")
+        await asyncio.sleep(0.01)
+        order.append("refresh:end")
+
+    async def _get_current_blocker() -> dict[str, object] | None:
+        order.append("blocker:start")
+        return {"type": "ask_user"}
+
+    flow.refresh = _refresh  # type: ignore[method-assign]
+    flow.get_current_blocker = _get_current_blocker  # type: ignore[method-assign]
+
+    assert await wait_for_initial_blocker(flow, timeout_s=5.0) == {"type": "ask_user"}
+    assert order == ["refresh:start", "blocker:start", "refresh:end"]
+
+
+def test_auto_answer_card_resolves_exact_then_nested_overrides() -> None:
+    card = {
+        "questions": [
+            {"field_key": "profile.plaintiff.name", "input_type": "text", "required": True},
+            {"field_key": "profile.defendant.name", "input_type": "text", "required": True},
+        ]
+    }
+    overrides = {
+        "profile.plaintiff": {"name": "嵌套原告"},
+        "profile.plaintiff.name": "精确原告",
+        "profile.defendant": {"name": "嵌套被告"},
+    }
+
+    answers = auto_answer_card(card, overrides=overrides)["answers"]
+
+    assert answers == [
+        {"field_key": "profile.plaintiff.name", "value": "精确原告"},
+        {"field_key": "profile.defendant.name", "value": "嵌套被告"},
+    ]
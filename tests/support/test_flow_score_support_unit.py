@@ -122,7 +122,7 @@ async def test_collect_flow_observability_falls_back_to_ai_engine_bundle(tmp_pat
         ),
         encoding="utf-8",
     )
-    monkeypatch.setattr("scripts._support.flow_score_support._repo_root", lambda: repo_root)
+    monkeypatch.setattr("scripts._support.flow_score_support._REPO_ROOT", repo_root)
 
     class StubClient:
         async def get_matter_timeline(self, matter_id: str, limit: int | None = None) -> dict:
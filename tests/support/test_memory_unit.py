@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from support.workbench.memory import wait_for_entity_keys, wait_for_memory_facts
+
+pytestmark = pytest.mark.skip_seed_bootstrap
+
+
+class _FactsClient:
+    def __init__(self, pages: list[list[dict[str, Any]]]) -> None:
+        self.pages = pages
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def get(self, path: str, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls.append((path, kwargs))
+        page = self.pages[min(len(self.calls), len(self.pages)) - 1]
+        return {"code": 0, "data": {"data": page}}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_memory_facts_fetches_once_per_tick_until_satisfied() -> None:
+    client = _FactsClient(
+        [
+            [{"entity_key": "party:plaintiff", "content": "原告张三"}],
+            [
+                {"entity_key": "party:plaintiff", "content": "原告张三"},
+                {"entity_key": "party:defendant", "content": "被告赵丽珍"},
+            ],
+        ]
+    )
+
+    facts = await wait_for_memory_facts(
+        client,
+        user_id=7,
+        case_id="m-1",
+        must_include_entity_keys=["party:plaintiff", "party:defendant"],
+        must_include_content=["赵丽珍"],
+        timeout_s=5.0,
+        interval_s=0.01,
+    )
+
+    assert len(facts) == 2
+    assert len(client.calls) == 2
+    assert client.calls[0][0] == "/memory-service/internal/memory/users/7/facts"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_entity_keys_reports_missing_keys_on_timeout() -> None:
+    client = _FactsClient([[{"entity_key": "party:plaintiff", "content": "原告"}]])
+
+    with pytest.raises(AssertionError, match=r"Missing=\['party:defendant'\]"):
+        await wait_for_entity_keys(
+            client,
+            user_id=7,
+            case_id="m-1",
+            must_include=["party:plaintiff", "party:defendant"],
+            timeout_s=0.05,
+            interval_s=0.01,
+        )
+
+
+@pytest.mark.asyncio
+async def test_wait_for_memory_facts_first_recheck_is_shorter_than_interval() -> None:
+    client = _FactsClient([[], [{"entity_key": "party:plaintiff", "content": "原告张三"}]])
+
+    started = time.monotonic()
+    await wait_for_memory_facts(
+        client,
+        user_id=7,
+        case_id="m-1",
+        must_include_entity_keys=["party:plaintiff"],
+        timeout_s=10.0,
+        interval_s=2.0,
+    )
+
+    assert len(client.calls) == 2
+    assert time.monotonic() - started < 1.5
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from support.workbench.phase_timeline import assert_has_deliverable, deliverable_output_keys, deliverables
+import pytest
+
+from support.workbench.phase_timeline import (
+    assert_has_deliverable,
+    assert_has_phases,
+    deliverable_output_keys,
+    deliverables,
+)
 
 
 def test_deliverables_reads_hard_cut_deliverables_field() -> None:
@@ -24,3 +31,11 @@ def test_assert_has_deliverable_requires_deliverables_contract() -> None:
     }
 
     assert_has_deliverable(payload, output_key="contract_review_report")
+
+
+def test_assert_has_phases_stops_once_required_phases_seen() -> None:
+    phase_tl = {"phases": [{"id": "intake"}, {"id": "analysis"}, {"id": "drafting"}]}
+
+    assert_has_phases(phase_tl, must_include=["intake", " analysis ", ""])
+    with pytest.raises(AssertionError, match=r"missing phases=\['review'\]. Have=\['analysis', 'drafting', 'intake'\]"):
+        assert_has_phases(phase_tl, must_include=["intake", "review"])
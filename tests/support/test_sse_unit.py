@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from support.workbench.sse import validate_task_events
+import pytest
+
+from support.workbench.sse import (
+    assert_has_end,
+    assert_has_user_message,
+    extract_last_card,
+    validate_task_events,
+)
 
 
 def test_validate_task_events_allows_run_skill_without_skill_id() -> None:
@@ -14,3 +21,22 @@ def test_validate_task_events_allows_run_skill_without_skill_id() -> None:
     }
 
     validate_task_events(sse)
+
+
+def test_last_event_helpers_read_newest_matching_event() -> None:
+    sse = {
+        "events": [
+            {"event": "user_message", "data": {"content": "第一条"}},
+            {"event": "card", "data": {"id": "old"}},
+            "not-an-event",
+            {"event": "card", "data": {}},
+            {"event": "user_message", "data": {"content": "第二条"}},
+            {"event": "error", "data": {"partial": True}},
+        ]
+    }
+
+    assert extract_last_card(sse) == {"id": "old"}
+    assert_has_user_message(sse, content_must_contain=["第二条"])
+    assert_has_end(sse)
+    with pytest.raises(AssertionError, match="missing user_message"):
+        assert_has_user_message({"events": [{"event": "card", "data": {}}]})
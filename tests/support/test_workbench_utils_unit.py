@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from support.workbench.utils import backoff_delay, eventually, extract_id, resolved, unwrap_api_dict, unwrap_list
+
+pytestmark = pytest.mark.skip_seed_bootstrap
+
+
+def test_backoff_delay_grows_exponentially_and_respects_cap() -> None:
+    assert backoff_delay(0, base_s=0.2, cap_s=2.0, jitter=0.0) == pytest.approx(0.2)
+    assert backoff_delay(2, base_s=0.2, cap_s=2.0, jitter=0.0) == pytest.approx(0.8)
+    assert backoff_delay(10, base_s=0.2, cap_s=2.0, jitter=0.0) == pytest.approx(2.0)
+    assert backoff_delay(10_000, base_s=0.2, cap_s=2.0, jitter=0.0) == pytest.approx(2.0)
+    for attempt in range(8):
+        delay = backoff_delay(attempt, base_s=0.2, cap_s=2.0, jitter=0.2)
+        assert 0.16 <= delay <= 2.4
+
+
+@pytest.mark.asyncio
+async def test_resolved_fills_a_gather_slot() -> None:
+    async def fetch() -> str:
+        return "row"
+
+    assert await asyncio.gather(fetch(), resolved({})) == ["row", {}]
+
+
+@pytest.mark.asyncio
+async def test_eventually_returns_first_truthy_value() -> None:
+    calls = {"n": 0}
+
+    async def _probe() -> str | None:
+        calls["n"] += 1
+        return "ready" if calls["n"] >= 3 else None
+
+    assert await eventually(_probe, timeout_s=5.0, interval_s=0.05) == "ready"
+    assert calls["n"] == 3
+
+
+@pytest.mark.asyncio
+async def test_eventually_times_out_with_last_value() -> None:
+    with pytest.raises(AssertionError, match="Timed out waiting for probe"):
+        await eventually(lambda: 0, timeout_s=0.2, interval_s=0.05, description="probe")
+
+
+def test_extract_id_reads_wrapped_data_field() -> None:
+    assert extract_id({"code": 0, "data": {"id": " f-1 ", "matter_id": 42}}) == "f-1"
+    assert extract_id({"code": 0, "data": {"id": "s-1", "matter_id": 42}}, key="matter_id") == "42"
+    assert extract_id({"code": 0, "data": None}) == ""
+    assert extract_id({"code": 0, "data": [{"id": "x"}]}) == ""
+    assert extract_id(None) == ""
+
+
+def test_unwrap_list_returns_dict_rows_for_key() -> None:
+    resp = {"code": 0, "data": {"traces": [{"node_id": "a"}, "junk", None, {"node_id": "b"}]}}
+
+    assert unwrap_list(resp, "traces") == [{"node_id": "a"}, {"node_id": "b"}]
+    assert unwrap_list({"traces": [{"node_id": "raw"}]}, "traces") == [{"node_id": "raw"}]
+    assert unwrap_list({"code": 0, "data": {"traces": None}}, "traces") == []
+    assert unwrap_list({"code": 0, "data": [{"node_id": "a"}]}, "traces") == []
+    assert unwrap_list(None, "traces") == []
+
+
+def test_unwrap_api_dict_returns_data_or_names_the_payload() -> None:
+    assert unwrap_api_dict({"code": 0, "data": {"id": 1}}, what="canvas") == {"id": 1}
+    assert unwrap_api_dict({"id": 2}, what="canvas") == {"id": 2}
+
+    with pytest.raises(AssertionError, match="unexpected timeline payload"):
+        unwrap_api_dict({"code": 0, "data": []}, what="timeline")